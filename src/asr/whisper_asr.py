@@ -3,9 +3,10 @@ Whisper Automatic Speech Recognition Module
 Converts audio to text with low latency.
 """
 
+import sys
 import whisper
 import numpy as np
-from typing import Union, Dict
+from typing import Union, Dict, Optional
 import torch
 
 
@@ -16,7 +17,15 @@ class WhisperASR:
     Converts audio to text with ~150-250ms latency per 2-second chunk.
     """
     
-    def __init__(self, model_size: str = "base", device: str = None):
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = None,
+        num_threads: Optional[int] = None,
+        compile_encoder: bool = False,
+        warmup: bool = False,
+        quantize: bool = False
+    ):
         """
         Initialize Whisper ASR.
         
@@ -26,6 +35,16 @@ class WhisperASR:
                        - base: 74M params, good balance (default)
                        - small: 244M params, better accuracy
             device: Device to run on ("cuda", "cpu", or None for auto)
+            num_threads: Intra-op threads for CPU inference. Applied with
+                         torch.set_num_threads, which is process-wide
+                         (None = leave torch's own default alone)
+            compile_encoder: Wrap the encoder in torch.compile(mode="reduce-overhead")
+                             (CUDA on Linux only; the first calls pay the compile
+                             cost, and any compile failure falls back to eager)
+            warmup: Run one dummy transcription after loading so the first
+                    real utterance doesn't pay lazy-init / compile cost
+            quantize: Apply dynamic int8 quantization to the Linear layers
+                      (CPU only; ignored on CUDA)
         """
         self.model_size = model_size
         
@@ -35,8 +54,21 @@ class WhisperASR:
         else:
             self.device = device
         
+        # Only override torch's thread count when explicitly asked to
+        if self.device == "cpu" and num_threads is not None:
+            torch.set_num_threads(num_threads)
+        
         self.model = None
         self._load_model()
+        
+        if quantize and self.device == "cpu":
+            self._quantize_int8()
+        
+        if compile_encoder:
+            self._compile_encoder()
+        
+        if warmup:
+            self._warmup()
     
     def _load_model(self):
         """Load Whisper model."""
@@ -44,6 +76,46 @@ class WhisperASR:
         self.model = whisper.load_model(self.model_size, device=self.device)
         print(f"✓ Whisper {self.model_size} loaded")
     
+    def _quantize_int8(self):
+        """
+        Apply dynamic int8 quantization to every Linear layer (CPU only).
+        
+        Whisper uses its own nn.Linear subclass, which quantize_dynamic skips
+        because it matches on exact type. For fp32 on CPU that subclass behaves
+        exactly like nn.Linear, so the layers are retyped before quantizing.
+        """
+        for module in self.model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        
+        self.model = torch.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        print(f"✓ Whisper {self.model_size} quantized to int8")
+    
+    def _compile_encoder(self):
+        """
+        Compile the audio encoder with CUDA-graph capture.
+        
+        Only the encoder is compiled: its input is always a fixed 30s mel
+        window, so one captured graph covers every call. The decoder's
+        kv-cache hooks change shape per token and would keep recompiling.
+        
+        torch 2.1 has no torch.compile on Windows, so the encoder stays eager
+        there, and also whenever compiling raises.
+        """
+        if self.device != "cuda" or sys.platform == "win32" or not hasattr(torch, "compile"):
+            return
+        
+        try:
+            self.model.encoder = torch.compile(self.model.encoder, mode="reduce-overhead")
+        except Exception as e:
+            print(f"torch.compile unavailable, keeping eager encoder: {e}")
+    
+    def _warmup(self):
+        """Run one short transcription to trigger lazy init (and compilation)."""
+        self.transcribe(np.zeros(16000, dtype=np.float32))
+    
     def transcribe(
         self, 
         audio: Union[np.ndarray, bytes],
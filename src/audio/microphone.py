@@ -3,11 +3,16 @@ Microphone Audio Streaming Module
 Captures real-time audio from microphone for voice processing.
 """
 
-import pyaudio
+import os
 import asyncio
-from typing import AsyncIterator, List, Dict
+from typing import AsyncIterator, List, Dict, Optional, Union
 import numpy as np
 
+try:
+    import pyaudio
+except ImportError:  # Offline test runs use the fake source (CODEVOICE_FAKE_MIC=1)
+    pyaudio = None
+
 
 class MicrophoneStream:
     """Real-time microphone audio streaming."""
@@ -16,17 +21,25 @@ class MicrophoneStream:
     SAMPLE_RATE = 16000        # 16 kHz (Whisper optimized)
     CHANNELS = 1               # Mono (VAD compatible)
     CHUNK_SIZE = 512           # 32 ms chunks (512 samples / 16000 Hz)
-    FORMAT = pyaudio.paInt16   # 16-bit PCM
+    FORMAT = pyaudio.paInt16 if pyaudio else 8  # 16-bit PCM (paInt16 == 8)
     
-    def __init__(self, device_id: int = None):
+    def __init__(self, device_id: int = None, fake: Optional[bool] = None):
         """
         Initialize microphone stream.
         
         Args:
             device_id: Microphone device ID (None = default device)
+            fake: Generate silent chunks instead of opening PortAudio
+                  (None = on when CODEVOICE_FAKE_MIC=1, as the test suite sets)
         """
+        if fake is None:
+            fake = os.environ.get("CODEVOICE_FAKE_MIC") == "1"
+        if not fake and pyaudio is None:
+            raise ImportError("pyaudio is required for live capture (or set CODEVOICE_FAKE_MIC=1)")
+        
         self.device_id = device_id
-        self.audio = pyaudio.PyAudio()
+        self.fake = fake
+        self.audio = None if fake else pyaudio.PyAudio()
         self.stream = None
     
     def list_devices(self) -> List[Dict]:
@@ -36,6 +49,14 @@ class MicrophoneStream:
         Returns:
             List of device info dictionaries
         """
+        if self.fake:
+            return [{
+                'index': 0,
+                'name': 'CodeVoice fake microphone',
+                'channels': self.CHANNELS,
+                'sample_rate': self.SAMPLE_RATE
+            }]
+        
         devices = []
         for i in range(self.audio.get_device_count()):
             device_info = self.audio.get_device_info_by_index(i)
@@ -48,21 +69,48 @@ class MicrophoneStream:
                 })
         return devices
     
-    async def stream_audio(self, duration: float = None) -> AsyncIterator[bytes]:
+    async def stream_audio(
+        self,
+        duration: float = None,
+        out: Optional[bytearray] = None
+    ) -> AsyncIterator[Union[bytes, memoryview]]:
         """
         Stream audio chunks from microphone.
         
         Args:
             duration: Duration in seconds (None = infinite stream)
+            out: Optional reusable buffer of at least CHUNK_SIZE * 2 bytes.
+                 When given, each chunk is copied into it and a memoryview of
+                 it is yielded, so consumers can keep one np.frombuffer view
+                 instead of wrapping a new bytes object per chunk. The
+                 contents are overwritten by the next chunk.
             
         Yields:
-            Audio chunks as bytes (512 samples each)
+            Audio chunks as bytes (512 samples each), or a memoryview of
+            `out` when a buffer is supplied
         
         Example:
             async for chunk in mic.stream_audio(duration=5.0):
                 # Process audio chunk
                 pass
         """
+        chunk_bytes = self.CHUNK_SIZE * 2  # 16-bit samples
+        view = None
+        if out is not None:
+            if len(out) < chunk_bytes:
+                raise ValueError(f"out buffer must hold at least {chunk_bytes} bytes")
+            view = memoryview(out)[:chunk_bytes]
+        
+        chunks_to_read = None
+        if duration is not None:
+            # Calculate number of chunks for given duration
+            chunks_to_read = int((duration * self.SAMPLE_RATE) / self.CHUNK_SIZE)
+        
+        if self.fake:
+            async for chunk in self._stream_fake(chunks_to_read, view):
+                yield chunk
+            return
+        
         # Open audio stream
         self.stream = self.audio.open(
             format=self.FORMAT,
@@ -74,11 +122,6 @@ class MicrophoneStream:
             stream_callback=None  # Blocking mode for simplicity
         )
         
-        chunks_to_read = None
-        if duration is not None:
-            # Calculate number of chunks for given duration
-            chunks_to_read = int((duration * self.SAMPLE_RATE) / self.CHUNK_SIZE)
-        
         try:
             chunk_count = 0
             while True:
@@ -89,7 +132,11 @@ class MicrophoneStream:
                     self.CHUNK_SIZE
                 )
                 
-                yield audio_data
+                if view is None:
+                    yield audio_data
+                else:
+                    view[:] = audio_data
+                    yield view
                 
                 chunk_count += 1
                 
@@ -104,6 +151,27 @@ class MicrophoneStream:
                 self.stream.close()
                 self.stream = None
     
+    async def _stream_fake(
+        self,
+        chunks_to_read: Optional[int],
+        view: Optional[memoryview]
+    ) -> AsyncIterator[Union[bytes, memoryview]]:
+        """
+        Yield silent chunks straight from memory, without real-time pacing.
+        
+        Each chunk still yields to the event loop, so an endless fake stream
+        (duration=None) can't starve other tasks.
+        """
+        silence = bytes(self.CHUNK_SIZE * 2)
+        if view is not None:
+            view[:] = silence
+        
+        chunk_count = 0
+        while not chunks_to_read or chunk_count < chunks_to_read:
+            await asyncio.sleep(0)
+            yield silence if view is None else view
+            chunk_count += 1
+    
     def close(self):
         """Close audio resources."""
         if self.stream:
@@ -61,13 +61,16 @@ class VADDetector:
             print("VAD will use fallback energy-based detection")
             self.model = None
     
-    def is_speech(self, audio_chunk: Union[bytes, np.ndarray]) -> bool:
+    @torch.inference_mode()
+    def is_speech(self, audio_chunk: Union[bytes, np.ndarray, torch.Tensor]) -> bool:
         """
         Detect if audio chunk contains speech.
         
         Args:
             audio_chunk: Audio data as bytes or numpy array
                         Expected: 16-bit PCM, 16kHz, mono
+                        A float32 torch.Tensor already normalized to [-1, 1]
+                        is used as-is, skipping the conversion
         
         Returns:
             True if speech detected, False otherwise
@@ -76,21 +79,29 @@ class VADDetector:
             >>> vad = VADDetector()
             >>> is_speaking = vad.is_speech(audio_bytes)
         """
-        # Convert bytes to numpy array if needed
-        if isinstance(audio_chunk, bytes):
-            audio_np = np.frombuffer(audio_chunk, dtype=np.int16)
+        if isinstance(audio_chunk, torch.Tensor):
+            if self.model is None:
+                return self._energy_based_detection(self._tensor_to_pcm(audio_chunk))
+            
+            # Fast path: already the model's input format
+            audio_tensor = audio_chunk
+            audio_np = None
         else:
-            audio_np = audio_chunk
-        
-        # If model failed to load, use energy-based fallback
-        if self.model is None:
-            return self._energy_based_detection(audio_np)
-        
-        # Convert to float32 normalized to [-1, 1]
-        audio_float = audio_np.astype(np.float32) / 32768.0
-        
-        # Convert to torch tensor
-        audio_tensor = torch.from_numpy(audio_float)
+            # Convert bytes to numpy array if needed
+            if isinstance(audio_chunk, bytes):
+                audio_np = np.frombuffer(audio_chunk, dtype=np.int16)
+            else:
+                audio_np = audio_chunk
+            
+            # If model failed to load, use energy-based fallback
+            if self.model is None:
+                return self._energy_based_detection(audio_np)
+            
+            # Convert to float32 normalized to [-1, 1]
+            audio_float = audio_np.astype(np.float32) / 32768.0
+            
+            # Convert to torch tensor
+            audio_tensor = torch.from_numpy(audio_float)
         
         # Silero VAD expects specific chunk sizes, pad if needed
         required_size = 512  # 32ms at 16kHz
@@ -101,17 +112,23 @@ class VADDetector:
             audio_tensor = audio_tensor[:required_size]
         
         try:
-            # Run VAD model
-            with torch.no_grad():
-                speech_prob = self.model(audio_tensor, self.SAMPLE_RATE).item()
+            # Run VAD model (autograd is off via inference_mode)
+            speech_prob = self.model(audio_tensor, self.SAMPLE_RATE).item()
             
             # Return True if probability exceeds threshold
             return speech_prob > self.threshold
         
         except Exception as e:
             # Fallback to energy-based detection if model fails
+            if audio_np is None:
+                audio_np = self._tensor_to_pcm(audio_chunk)
             return self._energy_based_detection(audio_np)
     
+    @staticmethod
+    def _tensor_to_pcm(audio_tensor: torch.Tensor) -> np.ndarray:
+        """Scale a normalized float tensor back to int16 range for energy detection."""
+        return audio_tensor.detach().cpu().numpy() * 32768.0
+    
     def _energy_based_detection(self, audio_np: np.ndarray) -> bool:
         """
         Fallback energy-based speech detection.
@@ -127,6 +144,7 @@ class VADDetector:
         
         return rms > energy_threshold
     
+    @torch.inference_mode()
     def get_speech_probability(self, audio_chunk: Union[bytes, np.ndarray]) -> float:
         """
         Get continuous speech probability score.
@@ -160,8 +178,7 @@ class VADDetector:
             audio_tensor = audio_tensor[:required_size]
         
         try:
-            with torch.no_grad():
-                speech_prob = self.model(audio_tensor, self.SAMPLE_RATE).item()
+            speech_prob = self.model(audio_tensor, self.SAMPLE_RATE).item()
             return speech_prob
         except:
             return 0.5  # Uncertain
@@ -9,17 +9,197 @@ Executes PowerShell commands with:
 - Working directory control
 - Environment variables
 - Exit code tracking
+- Optional persistent PowerShell host (no per-command startup cost)
 """
 
 import asyncio
+import os
 import subprocess
 import time
-from typing import Optional
+import uuid
+from typing import Optional, Tuple
 from pathlib import Path
 
 from .executor_base import BaseExecutor, TaskContext, TaskResult, TaskStatus
 
 
+class PowerShellSession:
+    """
+    Long-lived PowerShell process fed commands over stdin.
+    
+    Starting PowerShell costs 100-300ms on Windows. A session pays that
+    once and then runs each command in the same process, one at a time.
+    Every command is followed by a unique sentinel line on stdout (with
+    the exit code) and on stderr, which marks the end of its output.
+    """
+    
+    SENTINEL = "__CODEVOICE_EOT__"
+    
+    # Max bytes per output line (asyncio default of 64KB is too small for
+    # wide Format-Table output)
+    STREAM_LIMIT = 1024 * 1024
+    
+    def __init__(self, shell: str = "powershell.exe"):
+        """
+        Initialize session (the process starts on first use).
+        
+        Args:
+            shell: PowerShell executable to run
+        """
+        self.shell = shell
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+    
+    def is_running(self) -> bool:
+        """Check if the PowerShell process is alive."""
+        return self.process is not None and self.process.returncode is None
+    
+    async def start(self):
+        """Start the PowerShell process if it is not running."""
+        if self.is_running():
+            return
+        
+        self.process = await asyncio.create_subprocess_exec(
+            self.shell,
+            "-NoLogo",
+            "-NoProfile",
+            "-NonInteractive",
+            "-Command",
+            "-",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=self.STREAM_LIMIT
+        )
+    
+    async def run(
+        self,
+        command: str,
+        working_dir: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Run a single-line command in the session.
+        
+        Args:
+            command: Prepared (single-line) PowerShell command
+            working_dir: Directory to run in (defaults to current directory)
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            (exit_code, stdout, stderr)
+            
+        Raises:
+            asyncio.TimeoutError: If the command does not finish in time.
+            
+            On timeout, cancellation or any other error the process is
+            killed (its unread output would otherwise be returned to the
+            next command) and restarted on next use.
+        """
+        async with self._lock:
+            await self.start()
+            
+            marker = f"{self.SENTINEL}{uuid.uuid4().hex}"
+            script = self._wrap_command(command, marker, working_dir or os.getcwd())
+            
+            try:
+                self.process.stdin.write((script + "\n").encode("utf-8"))
+                await self.process.stdin.drain()
+                
+                (exit_code, output), error = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_stdout(marker),
+                        self._read_stderr(marker)
+                    ),
+                    timeout=timeout
+                )
+            except BaseException:
+                await self._kill()
+                raise
+            
+            return exit_code, output, error
+    
+    def _wrap_command(self, command: str, marker: str, working_dir: str) -> str:
+        """
+        Wrap a command so it is isolated and reports completion.
+        
+        The command runs in its own script block scope (variables do not
+        leak between commands), inside Push/Pop-Location so the working
+        directory is restored, and errors are caught so the sentinel is
+        always written. Exit code follows spawned -Command semantics: 0 if
+        the last statement succeeded ($?), 1 if it failed or a terminating
+        error reached the catch block. Earlier non-terminating errors do
+        not count.
+        """
+        location = working_dir.replace("'", "''")
+        command = command.rstrip().rstrip(";")
+        return (
+            "$global:LASTEXITCODE = 0; $global:__cv_ok = $false; "
+            f"Push-Location -LiteralPath '{location}'; "
+            f"try {{ & {{ {command}; $global:__cv_ok = $? }} | Out-Default }} "
+            "catch { $global:__cv_ok = $false; [Console]::Error.WriteLine($_.ToString()) } "
+            "finally { Pop-Location }; "
+            "$__cv_code = if ($global:__cv_ok) { 0 } else { 1 }; "
+            f"[Console]::Out.WriteLine('{marker} ' + $__cv_code); "
+            f"[Console]::Error.WriteLine('{marker}')"
+        )
+    
+    async def _read_stdout(self, marker: str) -> Tuple[int, str]:
+        """Read stdout up to the sentinel line and parse the exit code."""
+        lines = []
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                raise RuntimeError("PowerShell session exited unexpectedly")
+            
+            text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            if text.startswith(marker):
+                exit_code = int(text[len(marker):].strip() or 1)
+                return exit_code, "\n".join(lines).strip()
+            lines.append(text)
+    
+    async def _read_stderr(self, marker: str) -> str:
+        """Read stderr up to the sentinel line."""
+        lines = []
+        while True:
+            line = await self.process.stderr.readline()
+            if not line:
+                raise RuntimeError("PowerShell session exited unexpectedly")
+            
+            text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            if text == marker:
+                return "\n".join(lines).strip()
+            lines.append(text)
+    
+    async def _kill(self):
+        """Kill the PowerShell process."""
+        # Detach first so a cancel during wait() still leaves no stale process
+        process, self.process = self.process, None
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+                await process.wait()
+            except ProcessLookupError:
+                pass
+    
+    async def close(self):
+        """Exit the PowerShell process."""
+        async with self._lock:
+            if not self.is_running():
+                self.process = None
+                return
+            
+            try:
+                self.process.stdin.write(b"exit\n")
+                await self.process.stdin.drain()
+                self.process.stdin.close()
+                await asyncio.wait_for(self.process.wait(), timeout=2.0)
+            except (asyncio.TimeoutError, ConnectionResetError, BrokenPipeError):
+                await self._kill()
+            
+            self.process = None
+
+
 class PowerShellExecutor(BaseExecutor):
     """
     Executor for PowerShell commands.
@@ -27,10 +207,21 @@ class PowerShellExecutor(BaseExecutor):
     Runs commands in PowerShell and captures output, errors, and exit codes.
     """
     
-    def __init__(self):
-        """Initialize PowerShell executor."""
+    def __init__(self, persistent: bool = False):
+        """
+        Initialize PowerShell executor.
+        
+        Args:
+            persistent: Run commands in one long-lived PowerShell process
+                       instead of spawning a new one per command. Commands
+                       then run one at a time; tasks with custom
+                       environment variables still get their own process.
+                       Call close() when done.
+        """
         super().__init__()
         self.shell = "powershell.exe"
+        self.persistent = persistent
+        self._session: Optional[PowerShellSession] = None
     
     async def execute(self, context: TaskContext) -> TaskResult:
         """
@@ -60,10 +251,15 @@ class PowerShellExecutor(BaseExecutor):
                         latency_ms=(time.time() - start_time) * 1000
                     )
             
+            # Reuse the persistent host unless the task needs its own environment
+            if self.persistent and not context.environment:
+                return await self._execute_in_session(
+                    context, command, working_dir, start_time
+                )
+            
             # Setup environment
             env = None
             if context.environment:
-                import os
                 env = os.environ.copy()
                 env.update(context.environment)
             
@@ -137,6 +333,72 @@ class PowerShellExecutor(BaseExecutor):
                 latency_ms=latency_ms
             )
     
+    async def _execute_in_session(
+        self,
+        context: TaskContext,
+        command: str,
+        working_dir: Optional[Path],
+        start_time: float
+    ) -> TaskResult:
+        """
+        Execute a prepared command in the persistent PowerShell session.
+        
+        Args:
+            context: Task execution context
+            command: Prepared command string
+            working_dir: Resolved working directory, if any
+            start_time: Time execution started (for latency)
+            
+        Returns:
+            TaskResult with execution status and output
+        """
+        task_id = context.task_id
+        
+        if self._session is None:
+            self._session = PowerShellSession(self.shell)
+        
+        try:
+            exit_code, output, error = await self._session.run(
+                command,
+                working_dir=str(working_dir) if working_dir else None,
+                timeout=context.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            latency_ms = (time.time() - start_time) * 1000
+            return TaskResult(
+                task_id=task_id,
+                status=TaskStatus.TIMEOUT,
+                error=f"command timeout after {context.timeout_seconds}s",
+                latency_ms=latency_ms
+            )
+        
+        latency_ms = (time.time() - start_time) * 1000
+        
+        if exit_code == 0:
+            return self._create_success_result(
+                task_id=task_id,
+                output=output,
+                latency_ms=latency_ms,
+                metadata={
+                    "exit_code": exit_code,
+                    "command": command,
+                    "persistent": True
+                }
+            )
+        
+        return self._create_error_result(
+            task_id=task_id,
+            error=error if error else f"Command failed with exit code {exit_code}",
+            latency_ms=latency_ms,
+            output=output
+        )
+    
+    async def close(self):
+        """Shut down the persistent PowerShell session, if one was started."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
     def _prepare_command(self, command: str) -> str:
         """
         Prepare command for PowerShell execution.
@@ -180,9 +442,15 @@ class GitExecutor(PowerShellExecutor):
     Adds git-specific validation and formatting.
     """
     
-    def __init__(self):
-        """Initialize git executor."""
-        super().__init__()
+    def __init__(self, persistent: bool = False):
+        """
+        Initialize git executor.
+        
+        Args:
+            persistent: Run commands in one long-lived PowerShell process
+                       (see PowerShellExecutor)
+        """
+        super().__init__(persistent=persistent)
     
     async def execute(self, context: TaskContext) -> TaskResult:
         """
@@ -218,14 +486,24 @@ class PythonExecutor(PowerShellExecutor):
     Handles virtual environment activation and Python-specific features.
     """
     
-    def __init__(self, venv_path: Optional[str] = None):
+    def __init__(self, venv_path: Optional[str] = None, persistent: bool = False):
         """
         Initialize Python executor.
         
         Args:
             venv_path: Optional path to virtual environment
+            persistent: Run commands in one long-lived PowerShell process
+                       (see PowerShellExecutor). Not allowed with venv_path:
+                       Activate.ps1 changes process-wide $env:PATH, so the
+                       venv would stay active for later, unrelated commands.
+        
+        Raises:
+            ValueError: If both venv_path and persistent are given
         """
-        super().__init__()
+        if venv_path and persistent:
+            raise ValueError("persistent=True cannot be combined with venv_path")
+        
+        super().__init__(persistent=persistent)
         self.venv_path = venv_path
     
     async def execute(self, context: TaskContext) -> TaskResult:
@@ -15,7 +15,7 @@ import time
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from .executor_base import BaseExecutor, TaskContext, TaskResult, TaskStatus
 
@@ -51,6 +51,8 @@ class TaskScheduler:
         """
         self.max_concurrent_tasks = max_concurrent_tasks
         self._tasks: Dict[str, ScheduledTask] = {}
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._running_tasks: Set[asyncio.Task] = set()
         self._task_queue: asyncio.Queue = asyncio.Queue()
         self._active_tasks: int = 0
         self._lock = asyncio.Lock()
@@ -83,8 +85,10 @@ class TaskScheduler:
                 while self._active_tasks >= self.max_concurrent_tasks:
                     await asyncio.sleep(0.01)
                 
-                # Execute task
-                asyncio.create_task(self._execute_task(scheduled_task))
+                # Execute task (keep a reference so shutdown() can cancel it)
+                task = asyncio.create_task(self._execute_task(scheduled_task))
+                self._running_tasks.add(task)
+                task.add_done_callback(self._running_tasks.discard)
                 
             except Exception as e:
                 # Log error but keep worker running
@@ -111,9 +115,9 @@ class TaskScheduler:
                     started_at=datetime.now()
                 )
         
+        start_time = time.time()
+        
         try:
-            start_time = time.time()
-            
             # Execute the task
             result = await scheduled_task.executor.execute(scheduled_task.context)
             
@@ -121,6 +125,7 @@ class TaskScheduler:
             async with self._lock:
                 if task_id in self._tasks:
                     self._tasks[task_id].result = result
+            self._resolve(task_id, result)
             
         except Exception as e:
             # Handle execution error
@@ -136,11 +141,53 @@ class TaskScheduler:
             async with self._lock:
                 if task_id in self._tasks:
                     self._tasks[task_id].result = error_result
+            self._resolve(task_id, error_result)
+        
+        except asyncio.CancelledError:
+            self._abort(task_id, TaskStatus.CANCELLED, "Task cancelled", start_time)
+            raise
         
         finally:
+            # Any other BaseException: still wake the waiters
+            self._abort(task_id, TaskStatus.FAILED, "Task aborted", start_time)
+            
             async with self._lock:
                 self._active_tasks -= 1
     
+    def _resolve(self, task_id: str, result: TaskResult):
+        """Complete the task's future so wait_for() callers wake up."""
+        future = self._futures.get(task_id)
+        if future is not None and not future.done():
+            future.set_result(result)
+    
+    def _abort(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        error: str,
+        start_time: Optional[float] = None
+    ):
+        """
+        Finish a task that will never produce a result of its own.
+        
+        Does nothing if the task's future is already resolved, so it is
+        safe to call on every exit path.
+        """
+        future = self._futures.get(task_id)
+        if future is None or future.done():
+            return
+        
+        result = TaskResult(
+            task_id=task_id,
+            status=status,
+            error=error,
+            latency_ms=(time.time() - start_time) * 1000 if start_time else 0.0,
+            completed_at=datetime.now()
+        )
+        if task_id in self._tasks:
+            self._tasks[task_id].result = result
+        future.set_result(result)
+    
     async def submit_task(
         self,
         context: TaskContext,
@@ -156,22 +203,60 @@ class TaskScheduler:
         Returns:
             Task ID for tracking
         """
+        self._enqueue(context, executor)
+        return context.task_id
+    
+    def _enqueue(self, context: TaskContext, executor: BaseExecutor) -> asyncio.Future:
+        """
+        Register a task and queue it for the worker.
+        
+        Nothing here awaits, so it runs atomically on the event loop
+        without taking self._lock.
+        
+        Returns:
+            Future that resolves to the task's final TaskResult
+        """
         task_id = context.task_id
         
-        # Create scheduled task
         scheduled_task = ScheduledTask(
             context=context,
             executor=executor
         )
+        future = asyncio.get_running_loop().create_future()
         
-        # Store task
-        async with self._lock:
-            self._tasks[task_id] = scheduled_task
+        # Store task (and the future its waiters await)
+        self._tasks[task_id] = scheduled_task
+        self._futures[task_id] = future
+        
+        # Add to queue (unbounded, so never blocks)
+        self._task_queue.put_nowait(scheduled_task)
         
-        # Add to queue (non-blocking)
-        await self._task_queue.put(scheduled_task)
+        return future
+    
+    async def run(
+        self,
+        context: TaskContext,
+        executor: BaseExecutor,
+        timeout: Optional[float] = None
+    ) -> Optional[TaskResult]:
+        """
+        Submit a task and wait for its result in one call.
         
-        return task_id
+        Args:
+            context: Task execution context
+            executor: Executor to run the task
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            TaskResult when completed, or None on timeout (the task keeps
+            running and can still be awaited with wait_for())
+        """
+        future = self._enqueue(context, executor)
+        try:
+            # Shield so a timeout doesn't cancel the shared future
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
     
     def get_task_status(self, task_id: str) -> Optional[TaskStatus]:
         """
@@ -236,6 +321,38 @@ class TaskScheduler:
         """
         return self._task_queue.qsize()
     
+    async def wait_for(self, task_id: str) -> Optional[TaskResult]:
+        """
+        Wait until a task finishes, without polling.
+        
+        Args:
+            task_id: Task identifier
+            
+        Returns:
+            Final TaskResult, or None if the task is unknown
+        """
+        future = self._futures.get(task_id)
+        if future is None:
+            return self.get_task_result(task_id)
+        
+        # Shield so a cancelled waiter doesn't cancel the shared future
+        return await asyncio.shield(future)
+    
+    def futures(self, task_ids: List[str]) -> List[asyncio.Future]:
+        """
+        Get completion futures for several tasks.
+        
+        Useful with asyncio.as_completed() to handle results in finish
+        order. Unknown task IDs are skipped.
+        
+        Args:
+            task_ids: Task identifiers
+            
+        Returns:
+            Futures that resolve to each task's final TaskResult
+        """
+        return [self._futures[t] for t in task_ids if t in self._futures]
+    
     async def wait_for_task(
         self,
         task_id: str,
@@ -251,22 +368,55 @@ class TaskScheduler:
         Returns:
             TaskResult when completed, or None on timeout
         """
-        start_time = time.time()
+        try:
+            return await asyncio.wait_for(self.wait_for(task_id), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    async def wait_for_all(
+        self,
+        task_ids: List[str],
+        timeout: Optional[float] = None
+    ) -> List[Optional[TaskResult]]:
+        """
+        Wait for several tasks with a single asyncio.wait() call.
         
-        while True:
-            result = self.get_task_result(task_id)
-            
-            if result is not None and result.status != TaskStatus.RUNNING:
-                return result
+        Args:
+            task_ids: Task identifiers
+            timeout: Maximum time to wait in seconds
             
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    return None
+        Returns:
+            One entry per task ID, in order: the final TaskResult, or None
+            if the task is unknown or had not finished before the timeout
+        """
+        futures = [self._futures.get(task_id) for task_id in task_ids]
+        pending = {f for f in futures if f is not None and not f.done()}
+        
+        # asyncio.wait never cancels the futures, so no shield is needed
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+        
+        results = []
+        for task_id, future in zip(task_ids, futures):
+            if future is None:
+                results.append(self.get_task_result(task_id))
+            else:
+                results.append(future.result() if future.done() else None)
+        return results
+    
+    async def drain(self):
+        """
+        Wait until every submitted task has finished.
+        
+        Tasks submitted while draining are waited for as well.
+        """
+        while True:
+            pending = [f for f in self._futures.values() if not f.done()]
+            if not pending:
+                return
             
-            # Small delay before checking again
-            await asyncio.sleep(0.01)
+            # Shield so cancelling the drain leaves the task futures intact
+            await asyncio.gather(*(asyncio.shield(f) for f in pending))
     
     async def wait_for_all_tasks(self, timeout: Optional[float] = None):
         """
@@ -275,31 +425,19 @@ class TaskScheduler:
         Args:
             timeout: Maximum time to wait in seconds
         """
-        start_time = time.time()
-        
-        while True:
-            # Check if all tasks are complete
-            all_complete = True
-            
-            for scheduled_task in self._tasks.values():
-                result = scheduled_task.result
-                if result is None or result.status == TaskStatus.RUNNING:
-                    all_complete = False
-                    break
-            
-            if all_complete and self._active_tasks == 0:
-                break
-            
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    break
-            
-            await asyncio.sleep(0.01)
+        try:
+            await asyncio.wait_for(self.drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     async def shutdown(self):
-        """Shutdown the scheduler and wait for active tasks."""
+        """
+        Shutdown the scheduler and wait for active tasks.
+        
+        Tasks still running after the grace period are cancelled, and
+        queued tasks the worker never started are marked CANCELLED, so
+        every wait_for() caller gets a result.
+        """
         self._running = False
         
         # Wait for worker to stop
@@ -309,8 +447,23 @@ class TaskScheduler:
             except asyncio.TimeoutError:
                 self._worker_task.cancel()
         
+        # Nothing picks up queued tasks any more
+        while not self._task_queue.empty():
+            scheduled_task = self._task_queue.get_nowait()
+            self._abort(scheduled_task.context.task_id, TaskStatus.CANCELLED, "Scheduler shut down")
+        
         # Wait for active tasks to complete
         await self.wait_for_all_tasks(timeout=5.0)
+        
+        # Cancel stragglers; _execute_task resolves their futures as CANCELLED
+        stragglers = list(self._running_tasks)
+        for task in stragglers:
+            task.cancel()
+        if stragglers:
+            await asyncio.gather(*stragglers, return_exceptions=True)
+        
+        for task_id in list(self._futures):
+            self._abort(task_id, TaskStatus.CANCELLED, "Scheduler shut down")
     
     def clear_completed_tasks(self):
         """Remove completed tasks from storage to free memory."""
@@ -323,3 +476,4 @@ class TaskScheduler:
         
         for task_id in completed_ids:
             del self._tasks[task_id]
+            self._futures.pop(task_id, None)
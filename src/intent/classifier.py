@@ -107,6 +107,29 @@ class IntentClassifier:
         # Compute cosine similarity with all examples
         similarities = util.cos_sim(text_embedding, self.example_embeddings)[0]
         
+        best_intent, best_score, sorted_intents = self._rank_intents(similarities, top_k)
+        
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        
+        return IntentResult(
+            intent=best_intent,
+            confidence=float(best_score),
+            text=text,
+            latency_ms=latency_ms,
+            alternatives=sorted_intents[:top_k]
+        )
+    
+    def _rank_intents(self, similarities, top_k: int) -> tuple:
+        """
+        Aggregate example similarities into ranked intents.
+        
+        Args:
+            similarities: 1-D tensor of similarities against all examples
+            top_k: Number of top matches to consider
+            
+        Returns:
+            (best_intent, best_score, sorted_intents)
+        """
         # Get top K matches
         top_results = similarities.topk(k=min(top_k * 5, len(similarities)))
         
@@ -132,30 +155,66 @@ class IntentClassifier:
             best_intent = "general_query"
             best_score = 0.5
         
-        latency_ms = (time.perf_counter() - start_time) * 1000
-        
-        return IntentResult(
-            intent=best_intent,
-            confidence=float(best_score),
-            text=text,
-            latency_ms=latency_ms,
-            alternatives=sorted_intents[:top_k]
-        )
+        return best_intent, best_score, sorted_intents
     
-    async def classify_batch(self, texts: List[str]) -> List[IntentResult]:
+    async def classify_batch(self, texts: List[str], top_k: int = 3) -> List[IntentResult]:
         """
         Classify multiple texts in batch for efficiency.
         
+        All non-empty texts are encoded in a single model forward pass and
+        scored against the example index with one similarity matrix.
+        Each result's latency_ms is the batch time divided by batch size.
+        
         Args:
             texts: List of user command texts
+            top_k: Number of top matches to consider
             
         Returns:
-            List of IntentResults
+            List of IntentResults, in the same order as texts
         """
+        start_time = time.perf_counter()
+        
+        if not texts:
+            return []
+        
+        # Empty inputs get the same fallback as classify()
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        ranked = {}
+        
+        if indices:
+            # Encode all texts at once
+            text_embeddings = self.model.encode(
+                [texts[i] for i in indices],
+                convert_to_tensor=True,
+                show_progress_bar=False
+            )
+            
+            # [batch, n_examples] similarity matrix
+            similarities = util.cos_sim(text_embeddings, self.example_embeddings)
+            
+            for row, i in enumerate(indices):
+                ranked[i] = self._rank_intents(similarities[row], top_k)
+        
+        latency_ms = (time.perf_counter() - start_time) * 1000 / len(texts)
+        
         results = []
-        for text in texts:
-            result = await self.classify(text)
-            results.append(result)
+        for i, text in enumerate(texts):
+            if i in ranked:
+                best_intent, best_score, sorted_intents = ranked[i]
+                results.append(IntentResult(
+                    intent=best_intent,
+                    confidence=float(best_score),
+                    text=text,
+                    latency_ms=latency_ms,
+                    alternatives=sorted_intents[:top_k]
+                ))
+            else:
+                results.append(IntentResult(
+                    intent="general_query",
+                    confidence=0.3,
+                    text=text,
+                    latency_ms=latency_ms
+                ))
         return results
     
     def get_intent_info(self, intent_name: str) -> Optional[Dict]:
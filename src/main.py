@@ -4,6 +4,9 @@ Simple voice-to-text demonstration using Microphone → VAD → Whisper pipeline
 """
 
 import asyncio
+import math
+import os
+import sys
 import numpy as np
 from colorama import init, Fore, Style
 from audio.microphone import MicrophoneStream
@@ -17,13 +20,44 @@ init()
 class CodeVoiceDemo:
     """Simple voice-to-text demo."""
     
-    def __init__(self):
-        """Initialize all components."""
+    # Silence tail: 10 chunks = 320ms of silence triggers transcription
+    MAX_SILENCE_CHUNKS = 10
+    VOICED_MASK = (1 << MAX_SILENCE_CHUNKS) - 1
+    # Voiced chunks (out of the last 10) that count as a confident speech run
+    SPEECH_RUN_CHUNKS = 6
+    
+    def __init__(self, silence_rms_threshold: int = 200):
+        """
+        Initialize all components.
+        
+        Args:
+            silence_rms_threshold: Minimum int16 RMS of a collected utterance;
+                                   quieter buffers are VAD false triggers and
+                                   are dropped without running Whisper
+        """
         print(f"{Fore.CYAN}🚀 Initializing CodeVoice...{Style.RESET_ALL}")
         
         self.mic = MicrophoneStream()
         self.vad = VADDetector(threshold=0.5)
-        self.asr = WhisperASR(model_size="base")
+        # One intra-op thread per physical core on the CPU path (assumes two
+        # hardware threads per core); ignored when Whisper runs on CUDA
+        self.asr = WhisperASR(
+            model_size="base",
+            num_threads=max(1, (os.cpu_count() or 2) // 2),
+            warmup=True
+        )
+        self.silence_rms_threshold = silence_rms_threshold
+        
+        # Shift register of recent VAD decisions (1 bit per chunk, newest in bit 0)
+        self._voiced_mask: int = 0
+        
+        # Status lines printed on every utterance, composed once
+        self._MSG_LISTEN = f"{Fore.GREEN}● Speech detected...{Style.RESET_ALL}"
+        self._MSG_TX = f"\r{Fore.YELLOW}⏳ Transcribing...{Style.RESET_ALL}" + " " * 20
+        self._MSG_SAY_L = f"\r{Fore.CYAN}📝 You said:{Style.RESET_ALL} \"{Fore.WHITE}"
+        self._MSG_SAY_R = f"{Style.RESET_ALL}\"\n"
+        self._MSG_EMPTY = f"\r{Fore.RED}[No speech detected]{Style.RESET_ALL}\n"
+        self._MSG_SILENCE = f"\r{Fore.RED}[silence]{Style.RESET_ALL}" + " " * 20 + "\n"
         
         print(f"{Fore.GREEN}✓ All components loaded{Style.RESET_ALL}\n")
     
@@ -40,52 +74,72 @@ class CodeVoiceDemo:
         # Buffer to collect speech audio
         speech_buffer = []
         is_collecting = False
-        silence_chunks = 0
-        max_silence_chunks = 10  # 320ms of silence to trigger transcription
+        skip_vad = False
+        self._voiced_mask = 0
         
         try:
             async for audio_chunk in self.mic.stream_audio(duration=duration):
-                # Check if speech is present
-                is_speech = self.vad.is_speech(audio_chunk)
+                # Check if speech is present. Inside a confident speech run
+                # only every other chunk goes through VAD; the skipped one is
+                # treated as speech and the next chunk resyncs.
+                ran_vad = not skip_vad
+                if ran_vad:
+                    is_speech = self.vad.is_speech(audio_chunk)
+                else:
+                    is_speech = True
+                skip_vad = False
+                
+                self._voiced_mask = ((self._voiced_mask << 1) | int(is_speech)) & self.VOICED_MASK
                 
                 if is_speech:
                     if not is_collecting:
                         # Start of speech
-                        print(f"{Fore.GREEN}● Speech detected...{Style.RESET_ALL}", end='', flush=True)
+                        sys.stdout.write(self._MSG_LISTEN)
+                        sys.stdout.flush()
                         is_collecting = True
                     
                     # Add to buffer
                     speech_buffer.append(audio_chunk)
-                    silence_chunks = 0
+                    
+                    # Only a chunk VAD actually judged may arm the next skip;
+                    # otherwise assumed speech would keep re-arming it forever
+                    skip_vad = ran_vad and bin(self._voiced_mask).count("1") > self.SPEECH_RUN_CHUNKS
                 
                 elif is_collecting:
                     # Silence during collection
                     speech_buffer.append(audio_chunk)
-                    silence_chunks += 1
                     
-                    # If enough silence, transcribe
-                    if silence_chunks >= max_silence_chunks:
-                        print(f"\r{Fore.YELLOW}⏳ Transcribing...{Style.RESET_ALL}" + " " * 20, end='', flush=True)
-                        
-                        # Concatenate audio
-                        full_audio = np.concatenate([
-                            np.frombuffer(chunk, dtype=np.int16) 
-                            for chunk in speech_buffer
-                        ]).astype(np.float32) / 32768.0
+                    # If the last MAX_SILENCE_CHUNKS were all silent, transcribe
+                    if self._voiced_mask == 0:
+                        sys.stdout.write(self._MSG_TX)
+                        sys.stdout.flush()
                         
-                        # Transcribe
-                        result = self.asr.transcribe(full_audio)
-                        text = result['text'].strip()
+                        # Concatenate audio (one join + one view, no per-chunk arrays)
+                        raw = b"".join(speech_buffer)
+                        audio_i16 = np.frombuffer(raw, dtype=np.int16)
                         
-                        if text:
-                            print(f"\r{Fore.CYAN}📝 You said:{Style.RESET_ALL} \"{Fore.WHITE}{text}{Style.RESET_ALL}\"")
+                        # Energy gate: skip Whisper on noise-triggered silence
+                        rms_i16 = math.sqrt(np.square(audio_i16, dtype=np.int64).mean())
+                        if rms_i16 < self.silence_rms_threshold:
+                            sys.stdout.write(self._MSG_SILENCE)
                         else:
-                            print(f"\r{Fore.RED}[No speech detected]{Style.RESET_ALL}")
+                            full_audio = audio_i16.astype(np.float32) * np.float32(1.0 / 32768.0)
+                            
+                            # Transcribe
+                            result = self.asr.transcribe(full_audio)
+                            text = result['text'].strip()
+                            
+                            if text:
+                                sys.stdout.write(self._MSG_SAY_L)
+                                sys.stdout.write(text)
+                                sys.stdout.write(self._MSG_SAY_R)
+                            else:
+                                sys.stdout.write(self._MSG_EMPTY)
+                        sys.stdout.flush()
                         
                         # Reset buffer
                         speech_buffer = []
                         is_collecting = False
-                        silence_chunks = 0
         
         except KeyboardInterrupt:
             print(f"\n\n{Fore.YELLOW}⏹️  Stopped by user{Style.RESET_ALL}")
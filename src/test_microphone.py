@@ -3,13 +3,37 @@ Microphone Test & Diagnostic Tool
 Tests if audio capture is working and shows audio levels.
 """
 
+import math
 import numpy as np
 import pyaudio
 import time
 from colorama import init, Fore, Style
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 init()
 
+
+def _level_py(view_i16: np.ndarray) -> int:
+    """Sum of absolute sample values (NumPy fallback)."""
+    return int(np.abs(view_i16, dtype=np.int32).sum())
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _level(view_i16):
+        """Sum of absolute sample values in a single pass."""
+        s = 0
+        for i in range(view_i16.size):
+            s += abs(np.int32(view_i16[i]))
+        return s
+else:
+    _level = _level_py
+
+
 def test_microphone():
     """Test microphone and show audio levels."""
     print(f"\n{Fore.CYAN}{'='*60}")
@@ -48,11 +72,12 @@ def test_microphone():
         while True:
             # Read audio
             data = stream.read(512, exception_on_overflow=False)
-            audio_np = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+            view = np.frombuffer(data, dtype=np.int16)
             
-            # Calculate volume level
-            volume = np.abs(audio_np).mean()
-            db = 20 * np.log10(volume + 1e-10)
+            # Calculate volume level (mean absolute amplitude in [0, 1])
+            total = _level(view)
+            volume = total / (view.size * 32768.0)
+            db = math.log10(volume + 1e-10) * 20.0
             
             # Show level bar
             bar_length = int(min(50, max(0, (db + 60) / 60 * 50)))
@@ -75,8 +75,10 @@ async def test_all_commands():
     wrong = 0
     issues = []
 
-    for text, expected_intent in test_commands:
-        result = await classifier.classify(text)
+    # Classify every command in one batched forward pass
+    results = await classifier.classify_batch([text for text, _ in test_commands])
+
+    for (text, expected_intent), result in zip(test_commands, results):
         predicted_intent = result.intent
         confidence = result.confidence
         
@@ -120,11 +122,12 @@ async def test_all_commands():
         ("push to main branch", "git_push"),
     ]
 
-    for text, intent in entity_tests:
-        entities = extractor.extract(text, intent)
+    entity_results = await extractor.extract_batch(entity_tests)
+
+    for (text, intent), entity_result in zip(entity_tests, entity_results):
         print(f"📝 '{text}'")
         print(f"   Intent: {intent}")
-        print(f"   Entities: {entities}")
+        print(f"   Entities: {entity_result.entities}")
         print()
 
     print("="*80)
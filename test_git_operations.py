@@ -26,100 +26,73 @@ async def test_git_operations():
     print(f"{Fore.GREEN}🧪 Testing Git Operations{Style.RESET_ALL}")
     print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
     
-    scheduler = TaskScheduler(max_concurrent_tasks=5)
+    scheduler = TaskScheduler(max_concurrent_tasks=6)
+    # Spawn mode: a persistent host runs one command at a time, which would
+    # serialize the batch below
     ps_executor = PowerShellExecutor()
     file_executor = FileExecutor()
     
-    # Test 1: Git Status (Previously Failed)
-    print(f"{Fore.CYAN}Test 1: Git Status{Style.RESET_ALL}")
-    context = TaskContext(
-        intent="git_status",
-        command="git status",
-    )
-    task_id = await scheduler.submit_task(context, ps_executor)
-    result = await scheduler.wait_for_task(task_id, timeout=5.0)
+    # (title, success label, show full output, context, executor)
+    tests = [
+        (
+            "Test 1: Git Status", "Git Status", False,
+            TaskContext(intent="git_status", command="git status"),
+            ps_executor
+        ),
+        (
+            "Test 2: Git Log (Show Commits)", "Git Log", True,
+            TaskContext(intent="git_log", command="git log --oneline -5"),
+            ps_executor
+        ),
+        (
+            "Test 3: Git Remote", "Git Remote", True,
+            TaskContext(intent="git_remote", command="git remote -v"),
+            ps_executor
+        ),
+        (
+            "Test 4: Open Existing File (src/main.py)", "File Open", True,
+            TaskContext(
+                intent="open_file",
+                command="open src/main.py",
+                params={"file": "src/main.py"}
+            ),
+            file_executor
+        ),
+        (
+            "Test 5: List Source Files", "List Files", True,
+            TaskContext(
+                intent="list_files",
+                command="Get-ChildItem -Path src -Recurse -File -Name | Select-Object -First 10",
+            ),
+            ps_executor
+        ),
+        (
+            "Test 6: Python Version", "Python Version", True,
+            TaskContext(intent="python_version", command="python --version"),
+            ps_executor
+        ),
+    ]
     
-    if result and result.status == TaskStatus.SUCCESS:
-        print(f"{Fore.GREEN}✅ Git Status Works!{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{result.output[:200]}{Style.RESET_ALL}\n")
-    else:
-        print(f"{Fore.RED}❌ Failed: {result.error if result else 'Timeout'}{Style.RESET_ALL}\n")
+    # The operations are independent: submit all of them, then wait for
+    # the batch so total time is the slowest command, not the sum.
+    task_ids = await asyncio.gather(*[
+        scheduler.submit_task(context, executor)
+        for _, _, _, context, executor in tests
+    ])
+    results = await asyncio.gather(*[
+        scheduler.wait_for_task(task_id, timeout=6.0)
+        for task_id in task_ids
+    ])
     
-    # Test 2: Git Log
-    print(f"{Fore.CYAN}Test 2: Git Log (Show Commits){Style.RESET_ALL}")
-    context = TaskContext(
-        intent="git_log",
-        command="git log --oneline -5",
-    )
-    task_id = await scheduler.submit_task(context, ps_executor)
-    result = await scheduler.wait_for_task(task_id, timeout=5.0)
-    
-    if result and result.status == TaskStatus.SUCCESS:
-        print(f"{Fore.GREEN}✅ Git Log Works!{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{result.output}{Style.RESET_ALL}\n")
-    else:
-        print(f"{Fore.RED}❌ Failed: {result.error if result else 'Timeout'}{Style.RESET_ALL}\n")
-    
-    # Test 3: Check Remote
-    print(f"{Fore.CYAN}Test 3: Git Remote{Style.RESET_ALL}")
-    context = TaskContext(
-        intent="git_remote",
-        command="git remote -v",
-    )
-    task_id = await scheduler.submit_task(context, ps_executor)
-    result = await scheduler.wait_for_task(task_id, timeout=5.0)
-    
-    if result and result.status == TaskStatus.SUCCESS:
-        print(f"{Fore.GREEN}✅ Git Remote Works!{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{result.output}{Style.RESET_ALL}\n")
-    else:
-        print(f"{Fore.RED}❌ Failed: {result.error if result else 'Timeout'}{Style.RESET_ALL}\n")
-    
-    # Test 4: File Operations (Previously Failed)
-    print(f"{Fore.CYAN}Test 4: Open Existing File (src/main.py){Style.RESET_ALL}")
-    context = TaskContext(
-        intent="open_file",
-        command="open src/main.py",
-        params={"file": "src/main.py"}
-    )
-    task_id = await scheduler.submit_task(context, file_executor)
-    result = await scheduler.wait_for_task(task_id, timeout=5.0)
-    
-    if result and result.status == TaskStatus.SUCCESS:
-        print(f"{Fore.GREEN}✅ File Open Works!{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{result.output}{Style.RESET_ALL}\n")
-    else:
-        print(f"{Fore.RED}❌ Failed: {result.error if result else 'Timeout'}{Style.RESET_ALL}\n")
-    
-    # Test 5: List Project Files
-    print(f"{Fore.CYAN}Test 5: List Source Files{Style.RESET_ALL}")
-    context = TaskContext(
-        intent="list_files",
-        command="Get-ChildItem -Path src -Recurse -File -Name | Select-Object -First 10",
-    )
-    task_id = await scheduler.submit_task(context, ps_executor)
-    result = await scheduler.wait_for_task(task_id, timeout=5.0)
-    
-    if result and result.status == TaskStatus.SUCCESS:
-        print(f"{Fore.GREEN}✅ List Files Works!{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{result.output}{Style.RESET_ALL}\n")
-    else:
-        print(f"{Fore.RED}❌ Failed: {result.error if result else 'Timeout'}{Style.RESET_ALL}\n")
-    
-    # Test 6: Python Version (Was Working)
-    print(f"{Fore.CYAN}Test 6: Python Version{Style.RESET_ALL}")
-    context = TaskContext(
-        intent="python_version",
-        command="python --version",
-    )
-    task_id = await scheduler.submit_task(context, ps_executor)
-    result = await scheduler.wait_for_task(task_id, timeout=5.0)
-    
-    if result and result.status == TaskStatus.SUCCESS:
-        print(f"{Fore.GREEN}✅ Python Version Works!{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}{result.output}{Style.RESET_ALL}\n")
-    else:
-        print(f"{Fore.RED}❌ Failed: {result.error if result else 'Timeout'}{Style.RESET_ALL}\n")
+    for (title, label, full_output, _, _), result in zip(tests, results):
+        print(f"{Fore.CYAN}{title}{Style.RESET_ALL}")
+        
+        if result and result.status == TaskStatus.SUCCESS:
+            output = result.output if full_output else result.output[:200]
+            print(f"{Fore.GREEN}✅ {label} Works!{Style.RESET_ALL}")
+            print(f"{Fore.WHITE}{output}{Style.RESET_ALL}\n")
+        else:
+            print(f"{Fore.RED}❌ Failed: {result.error if result else 'Timeout'}{Style.RESET_ALL}\n")
     
     print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print(f"{Fore.GREEN}✅ All Tests Completed!{Style.RESET_ALL}")
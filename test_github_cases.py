@@ -22,6 +22,20 @@ from executor.executor_base import TaskContext, TaskStatus
 init()
 
 
+# Commands that don't depend on extracted entities
+_STATIC_CMDS = {
+    "git_status": "git status",
+    "search_code": "Get-ChildItem -Path . -Recurse -File | Select-Object Name, Directory | Format-Table",
+}
+
+# Commands built from extracted entities
+_DYNAMIC_CMDS = {
+    "git_commit": lambda e: f'git add -A ; git commit -m "{e.get("message", "Update")}"',
+    "git_push": lambda e: f"git push origin {e.get('branch', 'main')}",
+    "open_file": lambda e: f"open {e.get('file', '')}",
+}
+
+
 async def test_failed_cases():
     """Test the commands that failed in original demo."""
     print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
@@ -33,7 +47,7 @@ async def test_failed_cases():
     classifier = IntentClassifier()
     entities = EntityExtractor()
     scheduler = TaskScheduler(max_concurrent_tasks=5)
-    ps_executor = PowerShellExecutor()
+    ps_executor = PowerShellExecutor(persistent=True)  # One PowerShell process for the run
     file_executor = FileExecutor()
     
     test_cases = [
@@ -69,6 +83,10 @@ async def test_failed_cases():
         }
     ]
     
+    # Classify and map every case first, then run the resulting commands
+    # as one batch so wall time is the slowest command, not the sum.
+    pending = []  # [(case number, context, executor), ...]
+    
     for i, test_case in enumerate(test_cases, 1):
         print(f"\n{Fore.CYAN}{'─'*60}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Test {i}/{len(test_cases)}: {test_case['description']}{Style.RESET_ALL}")
@@ -98,16 +116,28 @@ async def test_failed_cases():
         
         print(f"{Fore.YELLOW}  Executing:{Style.RESET_ALL} {command}")
         
-        # Create context and execute
+        # Create context
         context = TaskContext(
             intent=intent_result.intent,
             command=command,
             params=entity_result.entities,
             timeout_seconds=5  # Shorter timeout for tests
         )
-        
-        task_id = await scheduler.submit_task(context, test_case['executor'])
-        result = await scheduler.wait_for_task(task_id, timeout=6.0)
+        pending.append((i, context, test_case['executor']))
+    
+    # Submit all, then wait for the whole batch
+    task_ids = await asyncio.gather(*[
+        scheduler.submit_task(context, executor)
+        for _, context, executor in pending
+    ])
+    results = await asyncio.gather(*[
+        scheduler.wait_for_task(task_id, timeout=6.0)
+        for task_id in task_ids
+    ])
+    
+    print(f"\n{Fore.CYAN}{'─'*60}{Style.RESET_ALL}")
+    for (i, context, _), result in zip(pending, results):
+        print(f"{Fore.CYAN}Test {i}/{len(test_cases)}:{Style.RESET_ALL} {context.command}")
         
         # Show result
         if result:
@@ -128,25 +158,17 @@ async def test_failed_cases():
     print(f"{Fore.GREEN}✅ Test completed!{Style.RESET_ALL}\n")
     
     await scheduler.shutdown()
+    await ps_executor.close()
 
 
 def map_to_command(intent: str, entities: dict) -> str:
     """Map intent to executable command."""
-    if intent == "git_status":
-        return "git status"
-    elif intent == "git_commit":
-        message = entities.get("message", "Update")
-        return f'git add -A ; git commit -m "{message}"'
-    elif intent == "git_push":
-        branch = entities.get("branch", "main")
-        return f"git push origin {branch}"
-    elif intent == "open_file":
-        file = entities.get("file", "")
-        return f"open {file}"
-    elif intent == "search_code":
-        return "Get-ChildItem -Path . -Recurse -File | Select-Object Name, Directory | Format-Table"
-    else:
-        return None
+    command = _STATIC_CMDS.get(intent)
+    if command is not None:
+        return command
+    
+    build = _DYNAMIC_CMDS.get(intent)
+    return build(entities) if build else None
 
 
 if __name__ == "__main__":
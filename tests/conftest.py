@@ -0,0 +1,131 @@
+"""
+Shared pytest configuration for the CodeVoice test suite.
+"""
+
+import asyncio
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+# Make src/ importable for every test module (once, without duplicates)
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from executor.file_executor import FileExecutor
+from executor.powershell_executor import PowerShellExecutor
+from executor.task_scheduler import TaskScheduler
+
+# Synthetic microphone audio by default, so tests never block on a PortAudio
+# stream; real-device tests are marked hw and pass fake=False explicitly.
+os.environ.setdefault("CODEVOICE_FAKE_MIC", "1")
+
+# uvloop's C event loop cuts per-task overhead in the scheduler tests.
+# It doesn't support Windows, where the stock asyncio loop is used.
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+
+def pytest_report_header(config):
+    """Show which event loop the async tests run on."""
+    policy = type(asyncio.get_event_loop_policy())
+    return f"event loop policy: {policy.__module__}.{policy.__name__}"
+
+
+def pytest_configure(config):
+    """Import the heavy ML stack once per process, before any test module is collected."""
+    for module_name in ("numpy", "torch", "whisper"):
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass  # The tests that need it report the failure themselves
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session (asyncio_mode = auto runs every async test on it)."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def session_tmp_dir(tmp_path_factory, worker_id):
+    """
+    Scratch directory shared by the session (one per xdist worker).
+    
+    Placed on RAM-backed /dev/shm when available (Linux), so file tests
+    never touch disk; otherwise falls back to pytest's temp dir.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir():
+        root = Path(tempfile.mkdtemp(prefix=f"codevoice-{worker_id}-", dir=shm))
+    else:
+        root = tmp_path_factory.mktemp(f"codevoice-{worker_id}")
+    
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def asr():
+    """
+    One Whisper model for the session, shared by test_asr and test_integration.
+    
+    Both modules are in xdist_group("whisper"), so the model loads once per
+    run. Imported here rather than at module level so collection still works
+    where whisper is not installed.
+    """
+    from asr.whisper_asr import WhisperASR
+    
+    # int8 dynamic quantization on CPU; export WHISPER_TEST_QUANT= to test fp32
+    quantize = os.environ.get("WHISPER_TEST_QUANT", "int8") == "int8"
+    # warmup=True runs one dummy transcribe so no test pays first-call cost
+    return WhisperASR(
+        num_threads=min(4, os.cpu_count() or 1),
+        warmup=True,
+        quantize=quantize
+    )
+
+
+@pytest.fixture(scope="session")
+def file_executor():
+    """File executor instance, shared by the session (all state lives in TaskContext)."""
+    return FileExecutor()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def ps_executor():
+    """
+    PowerShell executor backed by one persistent host for the whole session.
+    
+    Each command runs in the same powershell.exe process instead of paying
+    process startup per test; tasks with custom environment variables still
+    get their own process.
+    """
+    executor = PowerShellExecutor(persistent=True)
+    yield executor
+    await executor.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def scheduler():
+    """
+    One TaskScheduler for the whole session.
+    
+    Runs on the session event loop; shutdown() waits for any tasks a
+    test left behind.
+    """
+    scheduler = TaskScheduler(max_concurrent_tasks=5)
+    yield scheduler
+    await scheduler.shutdown()
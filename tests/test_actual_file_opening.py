@@ -6,57 +6,52 @@ This test verifies that the FileExecutor actually opens files in VS Code or defa
 import pytest
 import asyncio
 from pathlib import Path
-import sys
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from executor.file_executor import FileExecutor
 from executor.executor_base import TaskContext, TaskStatus
 
 
-@pytest.mark.asyncio
-async def test_file_executor_opens_file_in_vscode():
+@pytest.fixture(scope="session")
+def probe_files(tmp_path_factory):
+    """Create the files the opening tests target once; pytest removes the dir."""
+    probe_dir = tmp_path_factory.mktemp("probe")
+    files = [probe_dir / f"temp_open_{i}.txt" for i in range(3)]
+    for f in files:
+        f.write_text(f"Test content {f.name}")
+    return files
+
+
+async def test_file_executor_opens_file_in_vscode(probe_files):
     """Test that FileExecutor._open_file actually opens a file in VS Code."""
     executor = FileExecutor()
+    test_file = probe_files[0]
     
-    # Create a test file
-    test_file = Path("temp_actual_open_test.py")
-    test_file.write_text("# This file should open in VS Code\nprint('Testing actual file opening')")
+    # Open the file using FileExecutor
+    context = TaskContext(
+        intent="open_file",
+        command=f"open {test_file}",
+        params={"file": str(test_file)}
+    )
     
-    try:
-        # Open the file using FileExecutor
-        context = TaskContext(
-            intent="open_file",
-            command=f"open {test_file}",
-            params={"file": str(test_file)}
-        )
-        
-        result = await executor.execute(context)
-        
-        # Should succeed
-        assert result.status == TaskStatus.SUCCESS, f"Open failed: {result.error}"
-        
-        # Should mention VS Code or default app
-        assert "VS Code" in result.output or "default app" in result.output
-        
-        print(f"\n✓ {result.output}")
-        print(f"  Method: {result.metadata.get('method', 'unknown')}")
-        print(f"  Latency: {result.latency_ms:.1f}ms")
-        
-    finally:
-        # Cleanup
-        if test_file.exists():
-            test_file.unlink()
+    result = await executor.execute(context)
+    
+    # Should succeed
+    assert result.status == TaskStatus.SUCCESS, f"Open failed: {result.error}"
+    
+    # Should mention VS Code or default app
+    assert "VS Code" in result.output or "default app" in result.output
+    
+    print(f"\n✓ {result.output}")
+    print(f"  Method: {result.metadata.get('method', 'unknown')}")
+    print(f"  Latency: {result.latency_ms:.1f}ms")
 
 
-@pytest.mark.asyncio
 async def test_file_executor_opens_readme():
     """Test opening README.md file."""
     executor = FileExecutor()
     
     readme = Path("README.md")
-    if not readme.exists():
+    if not await asyncio.to_thread(readme.exists):
         pytest.skip("README.md not found")
     
     context = TaskContext(
@@ -71,7 +66,6 @@ async def test_file_executor_opens_readme():
     print(f"\n✓ Opened README.md: {result.output}")
 
 
-@pytest.mark.asyncio
 async def test_file_executor_handles_missing_file():
     """Test that opening non-existent file returns proper error."""
     executor = FileExecutor()
@@ -90,39 +84,26 @@ async def test_file_executor_handles_missing_file():
     print(f"\n✓ Correctly handled missing file: {result.error}")
 
 
-@pytest.mark.asyncio
-async def test_multiple_files_open_concurrently():
+async def test_multiple_files_open_concurrently(probe_files):
     """Test opening multiple files at once."""
     executor = FileExecutor()
     
-    # Create test files
-    test_files = [Path(f"temp_open_{i}.txt") for i in range(3)]
-    for f in test_files:
-        f.write_text(f"Test content {f.name}")
+    # Open all files concurrently
+    tasks = []
+    for test_file in probe_files:
+        context = TaskContext(
+            intent="open_file",
+            command=f"open {test_file}",
+            params={"file": str(test_file)}
+        )
+        tasks.append(executor.execute(context))
+    
+    results = await asyncio.gather(*tasks)
     
-    try:
-        # Open all files concurrently
-        tasks = []
-        for test_file in test_files:
-            context = TaskContext(
-                intent="open_file",
-                command=f"open {test_file}",
-                params={"file": str(test_file)}
-            )
-            tasks.append(executor.execute(context))
-        
-        results = await asyncio.gather(*tasks)
-        
-        # All should succeed
-        for i, result in enumerate(results):
-            assert result.status == TaskStatus.SUCCESS, f"File {i} failed: {result.error}"
-            print(f"✓ Opened {test_files[i].name}: {result.output[:50]}")
-        
-    finally:
-        # Cleanup
-        for f in test_files:
-            if f.exists():
-                f.unlink()
+    # All should succeed
+    for i, result in enumerate(results):
+        assert result.status == TaskStatus.SUCCESS, f"File {i} failed: {result.error}"
+        print(f"✓ Opened {probe_files[i].name}: {result.output[:50]}")
 
 
 if __name__ == "__main__":
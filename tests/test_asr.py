@@ -5,38 +5,48 @@ Tests: Model loading, transcription, latency
 
 import pytest
 import numpy as np
-import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Whisper-heavy: keep on one xdist worker so the model loads once
+pytestmark = pytest.mark.xdist_group("whisper")
 
-from asr.whisper_asr import WhisperASR
+# 2 seconds of test audio at 16kHz, generated once (transcribe never mutates its input)
+_RNG = np.random.default_rng(0)
+_SILENCE = np.zeros(16000 * 2, dtype=np.float32)
+_NOISE = _RNG.standard_normal(16000 * 2, dtype=np.float32) * np.float32(0.1)
+# The same 2 seconds as int16 PCM bytes (typical microphone format)
+_INT16_BYTES = np.random.default_rng(1).integers(-5000, 5000, 16000 * 2, dtype=np.int16).tobytes()
+
+
+# asr (one Whisper model for the session) lives in conftest.py
+
+
+@pytest.fixture(scope="module")
+def silence_audio():
+    """2 seconds of silence (float32)."""
+    return _SILENCE
+
+
+@pytest.fixture(scope="module")
+def noise_audio():
+    """2 seconds of seeded Gaussian noise (float32, std 0.1)."""
+    return _NOISE
 
 
 class TestWhisperASR:
     """Test Whisper speech recognition functionality."""
     
-    def test_whisper_init(self):
+    def test_whisper_init(self, asr):
         """Test Whisper ASR initialization."""
-        asr = WhisperASR()
         assert asr is not None
         assert asr.model_size == "base"
     
-    def test_whisper_model_loaded(self):
+    def test_whisper_model_loaded(self, asr):
         """Test Whisper model is properly loaded."""
-        asr = WhisperASR()
         assert asr.model is not None
         print(f"\n✓ Whisper model loaded: {type(asr.model).__name__}")
     
-    def test_transcribe_silence(self):
+    def test_transcribe_silence(self, asr, silence_audio):
         """Test transcription of silence returns empty or minimal text."""
-        asr = WhisperASR()
-        
-        # Generate 2 seconds of silence
-        duration = 2.0
-        silence_audio = np.zeros(int(16000 * duration), dtype=np.float32)
-        
         result = asr.transcribe(silence_audio)
         
         assert isinstance(result, dict)
@@ -45,46 +55,26 @@ class TestWhisperASR:
         assert len(result['text'].strip()) < 10
         print(f"\n✓ Silence transcription: '{result['text']}'")
     
-    def test_transcribe_returns_proper_format(self):
+    def test_transcribe_returns_proper_format(self, asr, noise_audio):
         """Test transcription returns proper dictionary format."""
-        asr = WhisperASR()
-        
-        # Generate synthetic audio (noise that might be mistaken for speech)
-        audio = np.random.randn(16000 * 2).astype(np.float32) * 0.1
-        
-        result = asr.transcribe(audio)
+        # Synthetic audio (noise that might be mistaken for speech)
+        result = asr.transcribe(noise_audio)
         
         assert isinstance(result, dict)
         assert 'text' in result
         assert isinstance(result['text'], str)
         print(f"\n✓ Result format correct")
     
-    def test_transcribe_latency(self):
-        """Test transcription latency (should be < 1000ms for 2 sec audio)."""
-        import time
-        
-        asr = WhisperASR()
-        
-        # Generate 2 seconds of audio
-        audio = np.random.randn(16000 * 2).astype(np.float32) * 0.1
+    @pytest.mark.benchmark
+    def test_transcribe_latency(self, asr, noise_audio):
+        """Benchmark transcription of 2 sec audio (timed by pytest --codspeed)."""
+        result = asr.transcribe(noise_audio)
         
-        start = time.perf_counter()
-        result = asr.transcribe(audio)
-        latency = (time.perf_counter() - start) * 1000
-        
-        # Base model should process 2sec audio in < 1000ms on modern hardware
-        assert latency < 2000, f"Latency {latency:.0f}ms too high"
-        print(f"\n✓ Transcription latency: {latency:.0f}ms for 2sec audio")
+        assert isinstance(result['text'], str)
     
-    def test_transcribe_with_bytes(self):
+    def test_transcribe_with_bytes(self, asr):
         """Test transcription accepts bytes input."""
-        asr = WhisperASR()
-        
-        # Generate audio as int16 bytes (typical microphone format)
-        audio_int16 = np.random.randint(-5000, 5000, 16000 * 2, dtype=np.int16)
-        audio_bytes = audio_int16.tobytes()
-        
-        result = asr.transcribe(audio_bytes)
+        result = asr.transcribe(_INT16_BYTES)
         
         assert isinstance(result, dict)
         assert 'text' in result
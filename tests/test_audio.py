@@ -5,11 +5,6 @@ Tests: Microphone initialization, audio capture, stream generation
 
 import pytest
 import numpy as np
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from audio.microphone import MicrophoneStream
 
@@ -32,18 +27,18 @@ class TestMicrophoneStream:
         assert len(devices) > 0
         print(f"\nFound {len(devices)} audio devices")
     
-    @pytest.mark.asyncio
     async def test_audio_stream_format(self):
         """Test audio stream produces correct format."""
         mic = MicrophoneStream()
         
+        # One buffer (and one numpy view of it) reused for every chunk
+        buf = bytearray(mic.CHUNK_SIZE * 2)
+        audio_np = np.frombuffer(buf, dtype=np.int16)
+        
         chunk_count = 0
-        async for audio_chunk in mic.stream_audio(duration=1.0):
-            assert isinstance(audio_chunk, bytes)
-            assert len(audio_chunk) > 0
-            
-            # Convert to numpy array
-            audio_np = np.frombuffer(audio_chunk, dtype=np.int16)
+        async for audio_chunk in mic.stream_audio(duration=1.0, out=buf):
+            assert isinstance(audio_chunk, memoryview)
+            assert len(audio_chunk) == len(buf)
             assert audio_np.shape[0] == mic.CHUNK_SIZE
             
             chunk_count += 1
@@ -53,7 +48,6 @@ class TestMicrophoneStream:
         assert chunk_count == 5
         print(f"\n✓ Captured {chunk_count} audio chunks successfully")
     
-    @pytest.mark.asyncio
     async def test_audio_stream_duration(self):
         """Test audio stream respects duration parameter."""
         mic = MicrophoneStream()
@@ -66,3 +60,19 @@ class TestMicrophoneStream:
         expected_chunks = int((0.5 * mic.SAMPLE_RATE) / mic.CHUNK_SIZE)
         assert abs(chunk_count - expected_chunks) <= 2  # Allow 2 chunk tolerance
         print(f"\n✓ Duration test: captured {chunk_count} chunks (expected ~{expected_chunks})")
+    
+    @pytest.mark.hw
+    async def test_real_microphone_stream(self):
+        """Test capture from the real default input device."""
+        mic = MicrophoneStream(fake=False)
+        
+        try:
+            chunk_count = 0
+            async for audio_chunk in mic.stream_audio(duration=0.5):
+                assert len(audio_chunk) == mic.CHUNK_SIZE * 2
+                chunk_count += 1
+            
+            expected_chunks = int((0.5 * mic.SAMPLE_RATE) / mic.CHUNK_SIZE)
+            assert abs(chunk_count - expected_chunks) <= 2
+        finally:
+            mic.close()
@@ -12,12 +12,8 @@ Testing:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-from pathlib import Path
-import sys
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from executor.executor_base import BaseExecutor, TaskContext, TaskResult, TaskStatus
 from executor.task_scheduler import TaskScheduler
@@ -25,9 +21,9 @@ from executor.task_scheduler import TaskScheduler
 
 # ==================== FIXTURES ====================
 
-@pytest.fixture
-async def base_executor():
-    """Mock executor for testing base functionality."""
+@pytest.fixture(scope="module")
+def base_executor():
+    """Mock executor for testing base functionality (stateless, shared per module)."""
     class MockExecutor(BaseExecutor):
         async def execute(self, context: TaskContext) -> TaskResult:
             """Mock execution that simulates work."""
@@ -42,7 +38,7 @@ async def base_executor():
     return MockExecutor()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def task_scheduler():
     """Task scheduler instance for testing."""
     scheduler = TaskScheduler(max_concurrent_tasks=5)
@@ -50,9 +46,16 @@ async def task_scheduler():
     await scheduler.shutdown()
 
 
+@pytest_asyncio.fixture(scope="module")
+async def shared_scheduler():
+    """Module-wide scheduler for tests that don't depend on its task history."""
+    scheduler = TaskScheduler(max_concurrent_tasks=5)
+    yield scheduler
+    await scheduler.shutdown()
+
+
 # ==================== BASE EXECUTOR TESTS ====================
 
-@pytest.mark.asyncio
 async def test_task_context_creation():
     """Test TaskContext creation with required fields."""
     context = TaskContext(
@@ -69,7 +72,6 @@ async def test_task_context_creation():
     assert context.created_at is not None
 
 
-@pytest.mark.asyncio
 async def test_task_context_defaults():
     """Test TaskContext with default values."""
     context = TaskContext(
@@ -83,7 +85,6 @@ async def test_task_context_defaults():
     assert context.timeout_seconds == 300  # Default 5 minutes
 
 
-@pytest.mark.asyncio
 async def test_base_executor_interface(base_executor):
     """Test that base executor implements required interface."""
     assert hasattr(base_executor, 'execute')
@@ -100,7 +101,6 @@ async def test_base_executor_interface(base_executor):
     assert result.status == TaskStatus.SUCCESS
 
 
-@pytest.mark.asyncio
 async def test_task_result_structure(base_executor):
     """Test TaskResult contains all required fields."""
     context = TaskContext(
@@ -117,7 +117,6 @@ async def test_task_result_structure(base_executor):
     assert result.latency_ms >= 0
 
 
-@pytest.mark.asyncio
 async def test_executor_error_handling(base_executor):
     """Test executor handles errors gracefully."""
     class FailingExecutor(BaseExecutor):
@@ -148,15 +147,13 @@ async def test_executor_error_handling(base_executor):
 
 # ==================== TASK SCHEDULER TESTS ====================
 
-@pytest.mark.asyncio
-async def test_scheduler_initialization(task_scheduler):
+async def test_scheduler_initialization(shared_scheduler):
     """Test task scheduler initializes correctly."""
-    assert task_scheduler is not None
-    assert task_scheduler.max_concurrent_tasks == 5
-    assert task_scheduler.get_active_tasks_count() == 0
+    assert shared_scheduler is not None
+    assert shared_scheduler.max_concurrent_tasks == 5
+    assert shared_scheduler.get_active_tasks_count() == 0
 
 
-@pytest.mark.asyncio
 async def test_scheduler_submit_task(task_scheduler, base_executor):
     """Test submitting a task to scheduler."""
     context = TaskContext(
@@ -170,14 +167,12 @@ async def test_scheduler_submit_task(task_scheduler, base_executor):
     assert len(task_id) > 0
     
     # Wait for task to complete
-    await asyncio.sleep(0.05)
-    result = task_scheduler.get_task_result(task_id)
+    result = await task_scheduler.wait_for(task_id)
     
     assert result is not None
     assert result.status == TaskStatus.SUCCESS
 
 
-@pytest.mark.asyncio
 async def test_scheduler_task_queue(task_scheduler, base_executor):
     """Test scheduler queues tasks properly."""
     contexts = [
@@ -193,59 +188,55 @@ async def test_scheduler_task_queue(task_scheduler, base_executor):
     assert len(task_ids) == 3
     assert len(set(task_ids)) == 3  # All unique
     
-    # Wait for all tasks to complete
-    await asyncio.sleep(0.1)
-    
-    for task_id in task_ids:
-        result = task_scheduler.get_task_result(task_id)
+    # Drain in completion order; a stuck task fails fast on the timeout
+    for next_done in asyncio.as_completed(task_scheduler.futures(task_ids), timeout=1.0):
+        result = await next_done
         assert result is not None
         assert result.status == TaskStatus.SUCCESS
 
 
-@pytest.mark.asyncio
 async def test_scheduler_concurrent_execution(task_scheduler):
     """Test scheduler executes tasks concurrently."""
+    # Every task blocks at the barrier until all 3 have arrived, so the
+    # batch can only finish if the scheduler really runs them side by side
+    barrier = asyncio.Barrier(3)
+    
     class SlowExecutor(BaseExecutor):
         async def execute(self, context: TaskContext) -> TaskResult:
-            await asyncio.sleep(0.1)  # Simulate slow task
+            await barrier.wait()
             return TaskResult(
                 task_id=context.task_id,
                 status=TaskStatus.SUCCESS,
                 output="Done",
-                latency_ms=100
+                latency_ms=0
             )
     
     executor = SlowExecutor()
     
-    # Submit 3 tasks that take 100ms each
-    import time
-    start_time = time.time()
-    
     task_ids = []
     for i in range(3):
         context = TaskContext(intent=f"slow_task_{i}", command=f"sleep {i}")
         task_id = await task_scheduler.submit_task(context, executor)
         task_ids.append(task_id)
     
-    # Wait for all to complete
-    await asyncio.sleep(0.3)
-    
-    elapsed = time.time() - start_time
-    
-    # Should complete in ~150ms (concurrent) not 300ms (sequential)
-    # Allow some overhead for task scheduling
-    assert elapsed < 0.35, f"Tasks should execute concurrently, took {elapsed}s"
+    # Wait for all to complete (sequential execution would deadlock here)
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(task_scheduler.wait_for(t) for t in task_ids)),
+            timeout=1.0
+        )
+    except asyncio.TimeoutError:
+        pytest.fail(f"Tasks did not execute concurrently ({barrier.n_waiting}/3 reached the barrier)")
     
     # All should be successful
-    for task_id in task_ids:
-        result = task_scheduler.get_task_result(task_id)
+    for result in results:
         assert result.status == TaskStatus.SUCCESS
 
 
-@pytest.mark.asyncio
 async def test_scheduler_max_concurrent_limit():
     """Test scheduler respects max concurrent task limit."""
     scheduler = TaskScheduler(max_concurrent_tasks=2)
+    gate = asyncio.Event()
     
     class CountingExecutor(BaseExecutor):
         active_count = 0
@@ -258,7 +249,8 @@ async def test_scheduler_max_concurrent_limit():
                 CountingExecutor.active_count
             )
             
-            await asyncio.sleep(0.05)
+            # Hold the slot until the test opens the gate
+            await gate.wait()
             
             CountingExecutor.active_count -= 1
             
@@ -266,7 +258,7 @@ async def test_scheduler_max_concurrent_limit():
                 task_id=context.task_id,
                 status=TaskStatus.SUCCESS,
                 output="Done",
-                latency_ms=50
+                latency_ms=0
             )
     
     executor = CountingExecutor()
@@ -278,8 +270,24 @@ async def test_scheduler_max_concurrent_limit():
         task_id = await scheduler.submit_task(context, executor)
         task_ids.append(task_id)
     
-    # Wait for all to complete
-    await asyncio.sleep(0.2)
+    # Let the first two take their slots, then give the worker extra turns
+    # to (wrongly) start a third while both are still held at the gate
+    async def until_full():
+        while CountingExecutor.active_count < 2:
+            await asyncio.sleep(0)
+    
+    await asyncio.wait_for(until_full(), timeout=1.0)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    
+    assert CountingExecutor.active_count == 2
+    
+    # Release everything and wait for all to complete
+    gate.set()
+    await asyncio.wait_for(scheduler.drain(), timeout=1.0)
+    
+    for task_id in task_ids:
+        assert scheduler.get_task_status(task_id) == TaskStatus.SUCCESS
     
     # Should never have more than 2 running at once
     assert CountingExecutor.max_seen <= 2, f"Max concurrent was {CountingExecutor.max_seen}, expected <= 2"
@@ -287,7 +295,6 @@ async def test_scheduler_max_concurrent_limit():
     await scheduler.shutdown()
 
 
-@pytest.mark.asyncio
 async def test_scheduler_task_status_tracking(task_scheduler, base_executor):
     """Test scheduler tracks task status correctly."""
     context = TaskContext(
@@ -302,13 +309,12 @@ async def test_scheduler_task_status_tracking(task_scheduler, base_executor):
     assert status in [TaskStatus.QUEUED, TaskStatus.RUNNING]
     
     # Wait for completion
-    await asyncio.sleep(0.05)
+    await task_scheduler.wait_for(task_id)
     
     status = task_scheduler.get_task_status(task_id)
     assert status == TaskStatus.SUCCESS
 
 
-@pytest.mark.asyncio
 async def test_scheduler_get_all_tasks(task_scheduler, base_executor):
     """Test getting list of all tasks."""
     # Submit multiple tasks
@@ -318,7 +324,9 @@ async def test_scheduler_get_all_tasks(task_scheduler, base_executor):
         task_id = await task_scheduler.submit_task(context, base_executor)
         task_ids.append(task_id)
     
-    await asyncio.sleep(0.1)
+    for next_done in asyncio.as_completed(task_scheduler.futures(task_ids), timeout=1.0):
+        result = await next_done
+        assert result.status == TaskStatus.SUCCESS
     
     # Get all tasks
     all_tasks = task_scheduler.get_all_tasks()
@@ -328,29 +336,116 @@ async def test_scheduler_get_all_tasks(task_scheduler, base_executor):
         assert task_id in [t.context.task_id for t in all_tasks]
 
 
-@pytest.mark.asyncio
-async def test_scheduler_latency(task_scheduler, base_executor):
-    """Test task scheduler submission latency is minimal."""
-    import time
+async def test_scheduler_drain(task_scheduler, base_executor):
+    """Test drain waits for every in-flight task."""
+    task_ids = []
+    for i in range(3):
+        context = TaskContext(intent=f"task_{i}", command=f"test {i}")
+        task_ids.append(await task_scheduler.submit_task(context, base_executor))
     
-    context = TaskContext(
-        intent="latency_test",
-        command="echo fast"
+    await task_scheduler.drain()
+    
+    for task_id in task_ids:
+        assert task_scheduler.get_task_status(task_id) == TaskStatus.SUCCESS
+
+
+class HangingExecutor(BaseExecutor):
+    """Blocks until cancelled; records the asyncio task running it."""
+    
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.task = None
+    
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.task = asyncio.current_task()
+        self.started.set()
+        await asyncio.Event().wait()
+
+
+async def test_scheduler_wait_for_cancelled_task(task_scheduler):
+    """Test wait_for returns a CANCELLED result when the running task is cancelled."""
+    executor = HangingExecutor()
+    context = TaskContext(intent="hang", command="never returns")
+    
+    task_id = await task_scheduler.submit_task(context, executor)
+    await asyncio.wait_for(executor.started.wait(), timeout=1.0)
+    executor.task.cancel()
+    
+    result = await asyncio.wait_for(task_scheduler.wait_for(task_id), timeout=1.0)
+    
+    assert result.status == TaskStatus.CANCELLED
+    assert task_scheduler.get_task_status(task_id) == TaskStatus.CANCELLED
+
+
+async def test_scheduler_drain_after_cancel(task_scheduler, base_executor):
+    """Test drain terminates when one of the tasks was cancelled."""
+    executor = HangingExecutor()
+    hung_id = await task_scheduler.submit_task(
+        TaskContext(intent="hang", command="never returns"), executor
+    )
+    done_id = await task_scheduler.submit_task(
+        TaskContext(intent="task", command="test"), base_executor
     )
+    await asyncio.wait_for(executor.started.wait(), timeout=1.0)
+    executor.task.cancel()
     
-    start = time.time()
-    task_id = await task_scheduler.submit_task(context, base_executor)
-    submit_latency = (time.time() - start) * 1000
+    await asyncio.wait_for(task_scheduler.drain(), timeout=1.0)
     
-    # Submission should be nearly instant (<5ms)
-    assert submit_latency < 5, f"Submission took {submit_latency}ms, expected <5ms"
+    assert task_scheduler.get_task_status(hung_id) == TaskStatus.CANCELLED
+    assert task_scheduler.get_task_status(done_id) == TaskStatus.SUCCESS
+
+
+async def test_scheduler_wait_for_all(task_scheduler, base_executor):
+    """Test wait_for_all returns results in task-ID order, None for unknown IDs."""
+    task_ids = []
+    for i in range(3):
+        context = TaskContext(intent=f"task_{i}", command=f"test {i}")
+        task_ids.append(await task_scheduler.submit_task(context, base_executor))
     
-    assert task_id is not None
+    results = await task_scheduler.wait_for_all(task_ids + ["does-not-exist"], timeout=5.0)
+    
+    assert [r.task_id for r in results[:3]] == task_ids
+    assert all(r.status == TaskStatus.SUCCESS for r in results[:3])
+    assert results[3] is None
+
+
+async def test_scheduler_run(task_scheduler, base_executor):
+    """Test run submits a task and returns its result in one call."""
+    context = TaskContext(intent="run_task", command="test run")
+    
+    result = await task_scheduler.run(context, base_executor, timeout=5.0)
+    
+    assert result.task_id == context.task_id
+    assert result.status == TaskStatus.SUCCESS
+    assert task_scheduler.get_task_status(context.task_id) == TaskStatus.SUCCESS
+
+
+async def test_scheduler_wait_for_unknown_task(task_scheduler):
+    """Test wait_for returns None for a task that was never submitted."""
+    assert await task_scheduler.wait_for("does-not-exist") is None
+
+
+def test_scheduler_latency(event_loop, shared_scheduler, base_executor, benchmark):
+    """Benchmark one submit-to-result round trip (timed by pytest --codspeed)."""
+    # Sync test so codspeed times the whole call, loop turns included
+    def round_trip():
+        context = TaskContext(
+            intent="latency_test",
+            command="echo fast"
+        )
+        return event_loop.run_until_complete(shared_scheduler.run(context, base_executor))
+    
+    result = benchmark(round_trip)
+    
+    # Leave nothing in flight for later tests on the shared scheduler
+    event_loop.run_until_complete(shared_scheduler.drain())
+    
+    assert result.status == TaskStatus.SUCCESS
 
 
 # ==================== INTEGRATION TESTS ====================
 
-@pytest.mark.asyncio
 async def test_full_task_lifecycle(task_scheduler, base_executor):
     """Test complete task lifecycle from submission to completion."""
     context = TaskContext(
@@ -368,7 +463,7 @@ async def test_full_task_lifecycle(task_scheduler, base_executor):
     assert status in [TaskStatus.QUEUED, TaskStatus.RUNNING]
     
     # 3. Wait for completion
-    await asyncio.sleep(0.05)
+    await task_scheduler.wait_for(task_id)
     
     # 4. Check final status
     status = task_scheduler.get_task_status(task_id)
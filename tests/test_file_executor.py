@@ -15,35 +15,37 @@ Testing:
 import pytest
 import asyncio
 from pathlib import Path
-import sys
 import os
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from os.path import isfile, isdir
 
 from executor.executor_base import TaskContext, TaskStatus
-from executor.file_executor import FileExecutor
 
+# Keep the module on one xdist worker so its session fixtures are built once
+pytestmark = pytest.mark.xdist_group("file")
 
-# ==================== FIXTURES ====================
 
-@pytest.fixture
-async def file_executor():
-    """File executor instance."""
-    return FileExecutor()
+# ==================== HELPERS ====================
+
+def read_file(path) -> str:
+    """Read a file's text (plain os-level open, no Path method dispatch)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# ==================== FIXTURES ====================
 
+# file_executor (shared by the session) lives in conftest.py
 
 @pytest.fixture
-def temp_test_dir(tmp_path):
-    """Create temporary directory for tests."""
-    test_dir = tmp_path / "codevoice_test"
+def temp_test_dir(session_tmp_dir, request):
+    """Per-test directory inside the shared session scratch dir."""
+    test_dir = session_tmp_dir / request.node.name
     test_dir.mkdir(exist_ok=True)
     return test_dir
 
 
 # ==================== FILE OPEN TESTS ====================
 
-@pytest.mark.asyncio
 async def test_file_open_existing(file_executor, temp_test_dir):
     """Test opening an existing file."""
     # Create test file
@@ -62,7 +64,6 @@ async def test_file_open_existing(file_executor, temp_test_dir):
     assert str(test_file) in result.output
 
 
-@pytest.mark.asyncio
 async def test_file_open_nonexistent(file_executor, temp_test_dir):
     """Test opening a non-existent file."""
     test_file = temp_test_dir / "nonexistent.txt"
@@ -81,7 +82,6 @@ async def test_file_open_nonexistent(file_executor, temp_test_dir):
 
 # ==================== FILE CREATE TESTS ====================
 
-@pytest.mark.asyncio
 async def test_file_create_new(file_executor, temp_test_dir):
     """Test creating a new file."""
     test_file = temp_test_dir / "new_file.txt"
@@ -98,11 +98,10 @@ async def test_file_create_new(file_executor, temp_test_dir):
     result = await file_executor.execute(context)
     
     assert result.status == TaskStatus.SUCCESS
-    assert test_file.exists()
-    assert "Hello CodeVoice" in test_file.read_text()
+    assert isfile(str(test_file))
+    assert "Hello CodeVoice" in read_file(test_file)
 
 
-@pytest.mark.asyncio
 async def test_file_create_with_directory(file_executor, temp_test_dir):
     """Test creating file in nested directory."""
     test_file = temp_test_dir / "subdir" / "test.py"
@@ -119,13 +118,12 @@ async def test_file_create_with_directory(file_executor, temp_test_dir):
     result = await file_executor.execute(context)
     
     assert result.status == TaskStatus.SUCCESS
-    assert test_file.exists()
-    assert test_file.parent.exists()
+    assert isfile(str(test_file))
+    assert isdir(os.path.dirname(str(test_file)))
 
 
 # ==================== FILE READ TESTS ====================
 
-@pytest.mark.asyncio
 async def test_file_read_content(file_executor, temp_test_dir):
     """Test reading file contents."""
     test_file = temp_test_dir / "read_test.txt"
@@ -147,7 +145,6 @@ async def test_file_read_content(file_executor, temp_test_dir):
 
 # ==================== FILE WRITE TESTS ====================
 
-@pytest.mark.asyncio
 async def test_file_write_content(file_executor, temp_test_dir):
     """Test writing to existing file."""
     test_file = temp_test_dir / "write_test.txt"
@@ -167,17 +164,16 @@ async def test_file_write_content(file_executor, temp_test_dir):
     result = await file_executor.execute(context)
     
     assert result.status == TaskStatus.SUCCESS
-    assert test_file.read_text() == new_content
+    assert read_file(test_file) == new_content
 
 
 # ==================== FILE DELETE TESTS ====================
 
-@pytest.mark.asyncio
 async def test_file_delete(file_executor, temp_test_dir):
     """Test deleting a file."""
     test_file = temp_test_dir / "delete_test.txt"
     test_file.write_text("To be deleted")
-    assert test_file.exists()
+    assert isfile(str(test_file))
     
     context = TaskContext(
         intent="delete_file",
@@ -188,12 +184,11 @@ async def test_file_delete(file_executor, temp_test_dir):
     result = await file_executor.execute(context)
     
     assert result.status == TaskStatus.SUCCESS
-    assert not test_file.exists()
+    assert not isfile(str(test_file))
 
 
 # ==================== FILE EXISTS TESTS ====================
 
-@pytest.mark.asyncio
 async def test_file_exists_check(file_executor, temp_test_dir):
     """Test checking if file exists."""
     test_file = temp_test_dir / "exists_test.txt"
@@ -213,7 +208,6 @@ async def test_file_exists_check(file_executor, temp_test_dir):
 
 # ==================== DIRECTORY TESTS ====================
 
-@pytest.mark.asyncio
 async def test_directory_create(file_executor, temp_test_dir):
     """Test creating a directory."""
     test_dir = temp_test_dir / "new_directory"
@@ -227,11 +221,9 @@ async def test_directory_create(file_executor, temp_test_dir):
     result = await file_executor.execute(context)
     
     assert result.status == TaskStatus.SUCCESS
-    assert test_dir.exists()
-    assert test_dir.is_dir()
+    assert isdir(str(test_dir))
 
 
-@pytest.mark.asyncio
 async def test_directory_list(file_executor, temp_test_dir):
     """Test listing directory contents."""
     # Create some files
@@ -253,7 +245,6 @@ async def test_directory_list(file_executor, temp_test_dir):
 
 # ==================== PATH RESOLUTION TESTS ====================
 
-@pytest.mark.asyncio
 async def test_relative_path_resolution(file_executor):
     """Test resolving relative paths."""
     context = TaskContext(
@@ -270,7 +261,6 @@ async def test_relative_path_resolution(file_executor):
 
 # ==================== ERROR HANDLING TESTS ====================
 
-@pytest.mark.asyncio
 async def test_invalid_file_operation(file_executor):
     """Test handling invalid file operations."""
     context = TaskContext(
@@ -287,7 +277,7 @@ async def test_invalid_file_operation(file_executor):
 
 # ==================== PERFORMANCE TESTS ====================
 
-@pytest.mark.asyncio
+@pytest.mark.slow
 async def test_file_operation_latency(file_executor, temp_test_dir):
     """Test file operations complete quickly."""
     test_file = temp_test_dir / "latency_test.txt"
@@ -6,26 +6,40 @@ Tests complete flow: Microphone → VAD → Whisper ASR
 import pytest
 import asyncio
 import numpy as np
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from audio.microphone import MicrophoneStream
 from audio.vad import VADDetector
-from asr.whisper_asr import WhisperASR
+
+# Whisper-heavy: keep on one xdist worker so the model loads once
+pytestmark = pytest.mark.xdist_group("whisper")
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture(scope="module")
+def mic():
+    """One microphone stream (PortAudio handle) for the module."""
+    mic = MicrophoneStream()
+    try:
+        yield mic
+    finally:
+        mic.close()
+
+
+@pytest.fixture(scope="module")
+def vad():
+    """One VAD detector for the module."""
+    return VADDetector()
+
+
+# asr (one Whisper model for the session, shared with test_asr) lives in conftest.py
 
 
 class TestIntegration:
     """Test complete audio processing pipeline."""
     
-    @pytest.mark.asyncio
-    async def test_microphone_to_vad_pipeline(self):
+    async def test_microphone_to_vad_pipeline(self, mic, vad):
         """Test mic → VAD pipeline."""
-        mic = MicrophoneStream()
-        vad = VADDetector()
-        
         speech_detected = False
         chunk_count = 0
         
@@ -44,23 +58,18 @@ class TestIntegration:
         print(f"\n✓ Processed {chunk_count} chunks through VAD")
         print(f"✓ Speech detected: {speech_detected}")
     
-    def test_vad_to_whisper_pipeline(self):
+    def test_vad_to_whisper_pipeline(self, vad, asr):
         """Test VAD → Whisper pipeline."""
-        vad = VADDetector()
-        asr = WhisperASR()
+        # Generate 2 seconds of synthetic audio as 512-sample chunks (one RNG call)
+        n_chunks = int(16000 * 2 / 512)
+        audio = np.random.default_rng(0).integers(-3000, 3000, size=(n_chunks, 512), dtype=np.int16)
         
-        # Generate 2 seconds of synthetic audio
-        audio_data = []
-        for _ in range(int(16000 * 2 / 512)):  # 2 seconds worth of 512-sample chunks
-            chunk = np.random.randint(-3000, 3000, 512, dtype=np.int16)
-            
+        for chunk in audio:
             # Check if VAD detects speech
             is_speech = vad.is_speech(chunk)
-            
-            audio_data.append(chunk)
         
-        # Concatenate all chunks
-        full_audio = np.concatenate(audio_data).astype(np.float32) / 32768.0
+        # Chunks are already contiguous; flatten the view and scale
+        full_audio = audio.reshape(-1).astype(np.float32) * np.float32(1.0 / 32768.0)
         
         # Transcribe
         result = asr.transcribe(full_audio)
@@ -70,17 +79,13 @@ class TestIntegration:
         print(f"\n✓ VAD → Whisper pipeline complete")
         print(f"✓ Transcription: '{result['text']}'")
     
-    @pytest.mark.asyncio
-    async def test_full_pipeline_latency(self):
+    @pytest.mark.slow
+    async def test_full_pipeline_latency(self, mic, vad, asr):
         """Test end-to-end latency: Mic → VAD → Whisper."""
         import time
         
-        mic = MicrophoneStream()
-        vad = VADDetector()
-        asr = WhisperASR()
-        
-        # Collect 2 seconds of audio
-        audio_chunks = []
+        # Collect 2 seconds of audio into one growing byte buffer
+        audio_buf = bytearray()
         chunk_count = 0
         
         pipeline_start = time.perf_counter()
@@ -91,13 +96,13 @@ class TestIntegration:
             is_speech = vad.is_speech(audio_chunk)
             vad_latency = (time.perf_counter() - vad_start) * 1000
             
-            audio_chunks.append(audio_chunk)
+            audio_buf += audio_chunk
             chunk_count += 1
         
-        # Stage 2: Concatenate audio
-        full_audio = np.concatenate([
-            np.frombuffer(chunk, dtype=np.int16) for chunk in audio_chunks
-        ]).astype(np.float32) / 32768.0
+        # Stage 2: One int16 view of the buffer, cast + scaled in a single pass
+        full_int16 = np.frombuffer(audio_buf, dtype=np.int16)
+        full_audio = np.empty(full_int16.shape, dtype=np.float32)
+        np.multiply(full_int16, np.float32(1.0 / 32768.0), out=full_audio, dtype=np.float32)
         
         # Stage 3: Whisper transcription
         asr_start = time.perf_counter()
@@ -115,12 +120,8 @@ class TestIntegration:
         # Whisper should process 2sec audio in < 1500ms
         assert asr_latency < 2000, f"ASR too slow: {asr_latency:.0f}ms"
     
-    def test_all_components_initialized(self):
+    def test_all_components_initialized(self, mic, vad, asr):
         """Test all components can be initialized together."""
-        mic = MicrophoneStream()
-        vad = VADDetector()
-        asr = WhisperASR()
-        
         assert mic is not None
         assert vad is not None
         assert asr is not None
@@ -131,5 +132,3 @@ class TestIntegration:
         
         print(f"\n✓ All components initialized successfully")
         print(f"✓ Available audio devices: {len(devices)}")
-        
-        mic.close()
@@ -0,0 +1,88 @@
+"""
+Tests for the CodeVoice demo loop (src/main.py)
+Microphone, VAD and Whisper are replaced with fakes, so only the
+collect/skip/flush logic in CodeVoiceDemo.run is exercised.
+"""
+
+import pytest
+
+import main
+from main import CodeVoiceDemo
+
+# One 512-sample chunk of loud int16 PCM (RMS 1000) and one of silence
+_SPEECH = (1000).to_bytes(2, "little", signed=True) * 512
+_SILENCE = bytes(512 * 2)
+
+
+# ==================== FAKES ====================
+
+class FakeMic:
+    """Yields a scripted list of chunks."""
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+    
+    async def stream_audio(self, duration=None):
+        for chunk in self.chunks:
+            yield chunk
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeVAD:
+    """Calls a chunk speech if it is not all zeros; counts calls."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def is_speech(self, audio_chunk):
+        self.calls += 1
+        return audio_chunk != _SILENCE
+
+
+class FakeASR:
+    """Records every transcription request."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def transcribe(self, audio):
+        self.calls.append(audio)
+        return {"text": "hello"}
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture
+def demo(monkeypatch):
+    """CodeVoiceDemo wired to fakes instead of PortAudio, Silero and Whisper."""
+    monkeypatch.setattr(main, "MicrophoneStream", lambda: FakeMic([]))
+    monkeypatch.setattr(main, "VADDetector", lambda threshold: FakeVAD())
+    monkeypatch.setattr(main, "WhisperASR", lambda **kwargs: FakeASR())
+    return CodeVoiceDemo()
+
+
+# ==================== TESTS ====================
+
+async def test_long_utterance_is_flushed_after_silence(demo):
+    """Test a long speech run is transcribed once the silence tail arrives."""
+    demo.mic = FakeMic([_SPEECH] * 20 + [_SILENCE] * 200)
+    
+    await demo.run(duration=10.0)
+    
+    # Every silent chunk after the run goes through VAD again
+    assert demo.vad.calls > 200
+    assert len(demo.asr.calls) == 1
+    assert demo.mic.closed
+
+
+async def test_speech_run_skips_some_vad_calls(demo):
+    """Test VAD is skipped on alternate chunks inside a confident speech run."""
+    demo.mic = FakeMic([_SPEECH] * 20)
+    
+    await demo.run(duration=10.0)
+    
+    assert demo.vad.calls < 20
+    assert demo.asr.calls == []  # No silence tail, so nothing flushed
@@ -0,0 +1,87 @@
+"""
+Unit Tests for Task Scheduler Routing
+Fast counterparts of test_system_controls.py: executors are mocked, so no
+PowerShell or Python process is spawned.
+
+Testing:
+1. Results from the executor reach wait_for_task()
+2. Executor exceptions become FAILED results
+3. Several mocked commands complete concurrently
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from executor.executor_base import TaskContext, TaskResult, TaskStatus
+from executor.powershell_executor import PowerShellExecutor
+
+
+# ==================== HELPERS ====================
+
+def canned_result(output: str):
+    """AsyncMock for execute() that echoes the context's task_id with a fixed output."""
+    return AsyncMock(side_effect=lambda context: TaskResult(
+        task_id=context.task_id,
+        status=TaskStatus.SUCCESS,
+        output=output
+    ))
+
+
+# ==================== ROUTING TESTS ====================
+
+async def test_git_status_routed_to_executor(scheduler):
+    """Test that a submitted command reaches the executor and its result comes back."""
+    executor = PowerShellExecutor()
+    context = TaskContext(
+        intent="git_status",
+        command="git status"
+    )
+    
+    with patch.object(PowerShellExecutor, "execute", canned_result("On branch main\n")) as execute:
+        result = await scheduler.run(context, executor, timeout=1.0)
+    
+    execute.assert_awaited_once_with(context)
+    assert result.status == TaskStatus.SUCCESS
+    assert result.task_id == context.task_id
+    assert "branch" in result.output
+
+
+async def test_executor_exception_becomes_failed_result(scheduler):
+    """Test that an exception raised by the executor is reported as FAILED."""
+    executor = PowerShellExecutor()
+    context = TaskContext(
+        intent="run_python",
+        command="python -c \"print(1)\""
+    )
+    
+    with patch.object(PowerShellExecutor, "execute", AsyncMock(side_effect=RuntimeError("boom"))):
+        result = await scheduler.run(context, executor, timeout=1.0)
+    
+    assert result.status == TaskStatus.FAILED
+    assert "boom" in result.error
+
+
+async def test_concurrent_commands_all_complete(scheduler):
+    """Test that several mocked commands all resolve."""
+    executor = PowerShellExecutor()
+    contexts = [
+        TaskContext(intent="git_log", command=f"git log --oneline -{i}")
+        for i in range(1, 4)
+    ]
+    
+    with patch.object(PowerShellExecutor, "execute", canned_result("abc1234 commit")) as execute:
+        task_ids = await asyncio.gather(
+            *(scheduler.submit_task(context, executor) for context in contexts)
+        )
+        results = await asyncio.gather(
+            *(scheduler.wait_for_task(task_id, timeout=1.0) for task_id in task_ids)
+        )
+    
+    assert execute.await_count == len(contexts)
+    assert [r.task_id for r in results] == list(task_ids)
+    assert all(r.status == TaskStatus.SUCCESS for r in results)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])